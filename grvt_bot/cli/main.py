@@ -9,7 +9,7 @@ import logging
 import sys
 import time
 import traceback
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -62,6 +62,9 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+_US_PER_DAY = 24 * 60 * 60 * 1_000_000
+
+
 def seconds_until_next_run(
     interval_minutes: int,
     now: Optional[datetime] = None,
@@ -72,18 +75,18 @@ def seconds_until_next_run(
     interval_minutes defines cadence in minutes (1, 5, 15, ...).
     """
     now = now or datetime.now()
-    interval_minutes = max(1, int(interval_minutes))
-
-    next_boundary = now.replace(second=0, microsecond=0)
-    if now > next_boundary:
-        next_boundary += timedelta(minutes=1)
-
-    minutes_since_midnight = next_boundary.hour * 60 + next_boundary.minute
-    remainder = minutes_since_midnight % interval_minutes
-    if remainder != 0:
-        next_boundary += timedelta(minutes=interval_minutes - remainder)
+    period_us = max(1, int(interval_minutes)) * 60_000_000
+
+    # Integer microseconds since local midnight; boundaries are multiples of the period.
+    # A wait that reaches the next midnight at the minute step stops there, as that is minute 0.
+    us_of_day = ((now.hour * 60 + now.minute) * 60 + now.second) * 1_000_000 + now.microsecond
+    next_minute_us = -(-us_of_day // 60_000_000) * 60_000_000
+    if next_minute_us >= _US_PER_DAY:
+        next_boundary_us = _US_PER_DAY
+    else:
+        next_boundary_us = -(-next_minute_us // period_us) * period_us
 
-    return max(0.0, (next_boundary - now).total_seconds()) + 0.05
+    return (next_boundary_us - us_of_day) / 1_000_000 + 0.05
 
 
 def seconds_until_data_fetch(
@@ -110,14 +113,15 @@ def timeframe_to_seconds(timeframe: str) -> int:
     return 60
 
 
+_SIDE_ALIASES = {"buy": "buy", "long": "buy", "sell": "sell", "short": "sell"}
+
+
 def normalize_side(raw_side: Any) -> Optional[str]:
     """Normalize strategy side values to exchange 'buy'/'sell'."""
-    side = str(raw_side).lower()
-    if side in {"buy", "long"}:
-        return "buy"
-    if side in {"sell", "short"}:
-        return "sell"
-    return None
+    side = _SIDE_ALIASES.get(raw_side) if isinstance(raw_side, str) else None
+    if side is None:
+        side = _SIDE_ALIASES.get(str(raw_side).lower())
+    return side
 
 
 def should_close_on_opposite_signal(
@@ -208,11 +212,6 @@ def extract_equity_usdt(account_summary: Optional[Dict[str, Any]]) -> Optional[f
     return None
 
 
-def build_client_order_id(loop_count: int) -> str:
-    """Build numeric client_order_id for idempotent submissions."""
-    return str((int(time.time() * 1000) + int(loop_count)) % 2_147_483_647)
-
-
 def _utc_now_iso() -> str:
     return datetime.utcnow().isoformat()
 
@@ -227,7 +226,6 @@ def run_adaptive_close(
     open_position: Optional[Dict[str, Any]],
     reason_tag: str,
     dry_run: bool,
-    seed: Optional[int] = None,
 ) -> Tuple[Dict[str, Any], bool, Dict[str, Any]]:
     """Run adaptive close flow and persist close attempt metadata."""
     state["pending_action"] = reason_tag
@@ -271,13 +269,14 @@ def run_adaptive_close(
         }
         state["open_position"] = None
     else:
-        result = executor.close_position_adaptive(
-            symbol=symbol,
-            side=close_side,
-            remaining_qty=qty,
-            config=config,
-            client_order_id_seed=seed,
-        )
+        use_stream = bool(config.get("execution", "close_use_book_stream", False))
+        with executor.book_stream(symbol, enabled=use_stream):
+            result = executor.close_position_adaptive(
+                symbol=symbol,
+                side=close_side,
+                remaining_qty=qty,
+                config=config,
+            )
         state["open_position"] = executor.get_open_position(symbol)
 
     prev_attempts = int(state.get("close_attempt_count", 0) or 0)
@@ -320,7 +319,7 @@ def load_strategy(name: str, config: ConfigManager, logger: logging.Logger) -> A
             )
         except ImportError as exc:
             logger.error(
-                "Failed to import PAXG strategy. Install optional dependencies: pandas ta"
+                "Failed to import PAXG strategy. Install optional dependencies: pandas numpy"
             )
             raise exc
         return PAXGMeanReversionStrategy(config, logger)
@@ -336,24 +335,34 @@ def refresh_strategy_data(
 ) -> Optional[int]:
     """Fetch latest candles, update strategy if supported, and return latest candle timestamp (ms)."""
     timeframe = str(getattr(strategy, "timeframe", "1m"))
-    klines = executor.fetch_ohlcv(symbol, timeframe, limit=100)
-    if not klines:
-        logger.warning("Failed to fetch OHLCV data")
-        return None
-
-    latest_open_ms = int(float(klines[-1][0]))
 
     if hasattr(strategy, "update_market_data"):
         import pandas as pd
 
+        candles = executor.fetch_ohlcv_array(symbol, timeframe, limit=100)
+        if candles is None or len(candles) == 0:
+            logger.warning("Failed to fetch OHLCV data")
+            return None
+
         df = pd.DataFrame(
-            klines,
-            columns=["timestamp", "open", "high", "low", "close", "volume"],
+            {
+                "timestamp": pd.to_datetime(candles["ts"], unit="ms"),
+                "open": candles["o"],
+                "high": candles["h"],
+                "low": candles["l"],
+                "close": candles["c"],
+                "volume": candles["v"],
+            }
         )
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
         strategy.update_market_data(df)
+        return int(candles["ts"][-1])
 
-    return latest_open_ms
+    klines = executor.fetch_ohlcv(symbol, timeframe, limit=100)
+    if not klines:
+        logger.warning("Failed to fetch OHLCV data")
+        return None
+
+    return int(float(klines[-1][0]))
 
 
 def main() -> int:
@@ -409,6 +418,8 @@ def main() -> int:
 
         logger.info("Initializing GRVT executor...")
         executor = GRVTExecutor(config, logger)
+        if bool(config.get("execution", "price_use_ticker_stream", False)):
+            executor.start_ticker_stream(config.SYMBOL)
 
         logger.info("Initializing strategy: %s", args.strategy)
         strategy = load_strategy(args.strategy, config, logger)
@@ -419,7 +430,8 @@ def main() -> int:
         state_store = StateStore(config.STATE_FILE, logger)
         state = state_store.load()
 
-        reconcile_result = state_store.reconcile(executor, config.SYMBOL)
+        startup_snapshot = executor.fetch_account_snapshot(config.SYMBOL)
+        reconcile_result = state_store.reconcile(executor, config.SYMBOL, snapshot=startup_snapshot)
         state = reconcile_result.state
         if reconcile_result.mismatch:
             alert_manager.send(
@@ -447,7 +459,6 @@ def main() -> int:
                     open_position=open_position,
                     reason_tag="startup_auto_flatten",
                     dry_run=args.dry_run,
-                    seed=0,
                 )
                 state["halted"] = True
                 result_code = str(close_result.get("code", "CLOSE_UNKNOWN"))
@@ -472,7 +483,12 @@ def main() -> int:
         if state.get("open_position") and hasattr(strategy, "current_position"):
             strategy.current_position = dict(state["open_position"])
 
-        account_summary = executor.get_account_summary()
+        # A startup flatten may have moved equity since the snapshot was taken.
+        account_summary = (
+            executor.get_account_summary()
+            if reconcile_result.mismatch
+            else startup_snapshot["balance"]
+        )
         equity_usdt = extract_equity_usdt(account_summary)
         if state.get("baseline_equity_usdt") is None and equity_usdt is not None:
             state["baseline_equity_usdt"] = equity_usdt
@@ -570,7 +586,6 @@ def main() -> int:
                             open_position=state.get("open_position"),
                             reason_tag="threshold_flatten",
                             dry_run=args.dry_run,
-                            seed=loop_count,
                         )
                         if not close_ok:
                             alert_manager.send(
@@ -618,7 +633,6 @@ def main() -> int:
                                 open_position=open_position,
                                 reason_tag="strategy_exit",
                                 dry_run=args.dry_run,
-                                seed=loop_count,
                             )
                             if close_ok:
                                 if hasattr(strategy, "current_position"):
@@ -650,7 +664,6 @@ def main() -> int:
                             open_position=open_position,
                             reason_tag="opposite_signal_exit",
                             dry_run=args.dry_run,
-                            seed=loop_count,
                         )
                         if close_ok:
                             if hasattr(strategy, "current_position"):
@@ -716,7 +729,7 @@ def main() -> int:
                 reason = signal.get("reason", "No reason provided")
                 logger.info("Signal received: %s | reason: %s", signal, reason)
 
-                market_limits = executor.get_market_limits(config.SYMBOL)
+                market_limits = executor.get_market_limits_compiled(config.SYMBOL)
                 reference_price = executor.get_reference_price(config.SYMBOL, side)
 
                 risk_decision = risk_engine.evaluate_entry(
@@ -755,7 +768,7 @@ def main() -> int:
                         amount=amount_base,
                         leverage=config.LEVERAGE,
                         params=order_params,
-                        client_order_id=build_client_order_id(loop_count),
+                        client_order_id=executor.next_client_order_id(),
                     )
                     if not order:
                         alert_manager.send("[ENTRY] Order placement failed", level="error")
@@ -816,6 +829,9 @@ def main() -> int:
                 except Exception:
                     logger.error("Strategy on_error handler raised an exception")
                 time.sleep(error_backoff_seconds)
+            finally:
+                # Persist debounced set_* changes once per iteration, including `continue` paths.
+                state_store.flush()
 
     except KeyboardInterrupt:
         logger.info("=" * 60)
@@ -837,6 +853,10 @@ def main() -> int:
             runtime_lock.release()
         return 1
     finally:
+        if "executor" in locals():
+            executor.stop_ticker_stream()
+        if "state_store" in locals():
+            state_store.flush()
         if runtime_lock:
             runtime_lock.release()
 
@@ -4,8 +4,8 @@ Core module containing executor and configuration management.
 
 from grvt_bot.core.executor import GRVTExecutor
 from grvt_bot.core.config import ConfigManager
-from grvt_bot.core.risk import RiskEngine, RiskDecision
-from grvt_bot.core.state import StateStore, ReconcileResult
+from grvt_bot.core.risk import MarketLimitsCompiled, RiskEngine, RiskDecision
+from grvt_bot.core.state import BatchedStateStore, StateStore, ReconcileResult
 from grvt_bot.core.alerts import AlertManager
 from grvt_bot.core.runtime_lock import RuntimeLock
 
@@ -14,7 +14,9 @@ __all__ = [
     "ConfigManager",
     "RiskEngine",
     "RiskDecision",
+    "MarketLimitsCompiled",
     "StateStore",
+    "BatchedStateStore",
     "ReconcileResult",
     "AlertManager",
     "RuntimeLock",
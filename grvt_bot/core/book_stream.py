@@ -0,0 +1,165 @@
+"""
+Background WebSocket order-book and ticker subscriptions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class OrderBookStream:
+    """
+    Keep the latest GRVT `book.s` snapshot (and optionally `mini.s` ticker) per symbol in memory.
+
+    The pysdk WebSocket client is asyncio-based; it runs on a private event loop
+    in a daemon thread so synchronous callers only read the snapshot dict.
+    """
+
+    def __init__(
+        self,
+        env_str: str,
+        parameters: Dict[str, Any],
+        logger: Optional[logging.Logger] = None,
+        depth: int = 10,
+        rate_ms: int = 500,
+    ):
+        self.env_str = env_str
+        self.parameters = dict(parameters)
+        self.logger = logger or logging.getLogger(__name__)
+        self.depth = max(1, int(depth))
+        self.rate_ms = max(1, int(rate_ms))
+
+        self._books: Dict[str, Dict[str, Any]] = {}
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Any = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None and self.running:
+            return self._loop
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="grvt-book-stream", daemon=True)
+        thread.start()
+        self._loop = loop
+        self._thread = thread
+        return loop
+
+    async def _ensure_client(self) -> None:
+        if self._client is None:
+            from pysdk.grvt_ccxt_env import GrvtEnv
+            from pysdk.grvt_ccxt_ws import GrvtCcxtWS
+
+            self._client = GrvtCcxtWS(
+                GrvtEnv(self.env_str),
+                asyncio.get_running_loop(),
+                self.logger,
+                parameters=self.parameters,
+            )
+            await self._client.initialize()
+
+    async def _connect_and_subscribe(self, symbol: str) -> None:
+        await self._ensure_client()
+
+        async def on_book(message: Dict[str, Any]) -> None:
+            feed = message.get("feed")
+            if isinstance(feed, dict):
+                self._books[symbol] = {"feed": feed, "received_at": time.monotonic()}
+
+        await self._client.subscribe(
+            stream="book.s",
+            callback=on_book,
+            params={"instrument": symbol, "depth": self.depth, "rate": self.rate_ms},
+        )
+
+    async def _connect_and_subscribe_ticker(self, symbol: str) -> None:
+        await self._ensure_client()
+
+        async def on_ticker(message: Dict[str, Any]) -> None:
+            feed = message.get("feed")
+            if isinstance(feed, dict):
+                self._tickers[symbol] = {"feed": feed, "received_at": time.monotonic()}
+
+        await self._client.subscribe(
+            stream="mini.s",
+            callback=on_ticker,
+            params={"instrument": symbol, "rate": self.rate_ms},
+        )
+
+    def start(self, symbol: str, timeout: float = 10.0) -> bool:
+        """Subscribe to symbol's book; return False when the stream cannot be started."""
+        try:
+            loop = self._ensure_loop()
+            future = asyncio.run_coroutine_threadsafe(self._connect_and_subscribe(symbol), loop)
+            future.result(timeout=timeout)
+            self.logger.info("Order book stream subscribed: %s", symbol)
+            return True
+        except Exception as exc:
+            self.logger.warning("Order book stream unavailable for %s: %s", symbol, exc)
+            return False
+
+    def start_ticker(self, symbol: str, timeout: float = 10.0) -> bool:
+        """Subscribe to symbol's mini ticker; return False when the stream cannot be started."""
+        try:
+            loop = self._ensure_loop()
+            future = asyncio.run_coroutine_threadsafe(
+                self._connect_and_subscribe_ticker(symbol), loop
+            )
+            future.result(timeout=timeout)
+            self.logger.info("Ticker stream subscribed: %s", symbol)
+            return True
+        except Exception as exc:
+            self.logger.warning("Ticker stream unavailable for %s: %s", symbol, exc)
+            return False
+
+    def ticker(self, symbol: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+        """Return the latest raw ticker feed for symbol when newer than max_age_seconds."""
+        entry = self._tickers.get(symbol)
+        if not entry:
+            return None
+        if time.monotonic() - entry["received_at"] > max_age_seconds:
+            return None
+        return entry["feed"]
+
+    def snapshot(self, symbol: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+        """Return the latest raw book feed for symbol when newer than max_age_seconds."""
+        entry = self._books.get(symbol)
+        if not entry:
+            return None
+        if time.monotonic() - entry["received_at"] > max_age_seconds:
+            return None
+        return entry["feed"]
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close WebSocket connections and stop the background loop."""
+        loop = self._loop
+        if loop is None:
+            return
+
+        client = self._client
+        if client is not None and self.running:
+            try:
+                asyncio.run_coroutine_threadsafe(client.__aexit__(), loop).result(timeout=timeout)
+            except Exception as exc:
+                self.logger.warning("Order book stream shutdown error: %s", exc)
+
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if not self._thread.is_alive():
+                loop.close()
+
+        self._client = None
+        self._loop = None
+        self._thread = None
+        self._books.clear()
+        self._tickers.clear()
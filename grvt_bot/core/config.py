@@ -10,14 +10,31 @@ Supports loading configuration from:
 import os
 import copy
 import yaml
-from typing import Dict, Any, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
 
+def _freeze(tree: Dict[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a nested dict (nested dicts become MappingProxyType)."""
+    return MappingProxyType(
+        {key: _freeze(value) if isinstance(value, dict) else value for key, value in tree.items()}
+    )
+
+
+def _thaw(tree: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a mutable nested dict copy of a frozen tree."""
+    return {
+        key: _thaw(value) if isinstance(value, Mapping) else value for key, value in tree.items()
+    }
+
+
 class ConfigManager:
     """Manages bot configuration from multiple sources."""
     
-    DEFAULT_CONFIG = {
+    # Built once at import and read-only; each instance gets its own mutable copy.
+    DEFAULT_CONFIG = _freeze({
         'grvt': {
             'env': 'testnet',
             'api_key': '',
@@ -61,11 +78,15 @@ class ConfigManager:
         },
         'execution': {
             'close_mode': 'reduce_only_twap_slice',
+            'close_use_book_stream': False,
+            'price_use_ticker_stream': False,
             'liquidity_usage_pct': 0.20,
             'orderbook_levels': 20,
             'max_slippage_bps': 20,
             'close_min_slice_qty': 0.01,
             'close_retry_interval_seconds': 2,
+            'close_retry_cap_seconds': 16,
+            'close_retry_jitter': True,
             'close_max_retries': 20,
             'close_max_duration_seconds': 90,
             'close_no_progress_retries': 3,
@@ -78,8 +99,43 @@ class ConfigManager:
             'telegram_bot_token': '',
             'telegram_chat_id': '',
         },
-    }
+    })
     
+    # Value types, by (section, key), for values that arrive as strings (env vars) or through set().
+    _INT_KEYS = frozenset({
+        ('trading', 'leverage'),
+        ('trading', 'loop_interval'),
+        ('ops', 'data_close_buffer_seconds'),
+        ('ops', 'error_backoff_seconds'),
+        ('ops', 'max_repeated_errors'),
+        ('ops', 'repeated_error_window_seconds'),
+        ('execution', 'orderbook_levels'),
+        ('execution', 'max_slippage_bps'),
+        ('execution', 'close_retry_interval_seconds'),
+        ('execution', 'close_retry_cap_seconds'),
+        ('execution', 'close_max_retries'),
+        ('execution', 'close_max_duration_seconds'),
+        ('execution', 'close_no_progress_retries'),
+    })
+    _FLOAT_KEYS = frozenset({
+        ('trading', 'order_size_usdt'),
+        ('risk', 'risk_per_trade_pct'),
+        ('risk', 'min_notional_safety_factor'),
+        ('execution', 'liquidity_usage_pct'),
+        ('execution', 'close_min_slice_qty'),
+        ('execution', 'position_qty_tolerance'),
+    })
+    _BOOL_KEYS = frozenset({
+        ('risk', 'fail_closed'),
+        ('risk', 'kill_switch'),
+        ('alerts', 'enabled'),
+        ('alerts', 'telegram_enabled'),
+        ('execution', 'fail_halt_on_close_failure'),
+        ('execution', 'close_use_book_stream'),
+        ('execution', 'price_use_ticker_stream'),
+        ('execution', 'close_retry_jitter'),
+    })
+
     def __init__(self, config_path: Optional[str] = None, config_dict: Optional[Dict] = None):
         """
         Initialize configuration manager.
@@ -88,8 +144,8 @@ class ConfigManager:
             config_path: Path to YAML config file
             config_dict: Dictionary with config values (for backward compatibility)
         """
-        # Deep copy avoids cross-instance mutation of nested dictionaries.
-        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        # Fresh nested dicts per instance; the shared defaults stay frozen.
+        self.config = _thaw(self.DEFAULT_CONFIG)
         
         # Load from YAML file if provided
         if config_path:
@@ -141,11 +197,15 @@ class ConfigManager:
             'OPS_MAX_REPEATED_ERRORS': ('ops', 'max_repeated_errors'),
             'OPS_REPEATED_ERROR_WINDOW_SECONDS': ('ops', 'repeated_error_window_seconds'),
             'EXECUTION_CLOSE_MODE': ('execution', 'close_mode'),
+            'EXECUTION_CLOSE_USE_BOOK_STREAM': ('execution', 'close_use_book_stream'),
+            'EXECUTION_PRICE_USE_TICKER_STREAM': ('execution', 'price_use_ticker_stream'),
             'EXECUTION_LIQUIDITY_USAGE_PCT': ('execution', 'liquidity_usage_pct'),
             'EXECUTION_ORDERBOOK_LEVELS': ('execution', 'orderbook_levels'),
             'EXECUTION_MAX_SLIPPAGE_BPS': ('execution', 'max_slippage_bps'),
             'EXECUTION_CLOSE_MIN_SLICE_QTY': ('execution', 'close_min_slice_qty'),
             'EXECUTION_CLOSE_RETRY_INTERVAL_SECONDS': ('execution', 'close_retry_interval_seconds'),
+            'EXECUTION_CLOSE_RETRY_CAP_SECONDS': ('execution', 'close_retry_cap_seconds'),
+            'EXECUTION_CLOSE_RETRY_JITTER': ('execution', 'close_retry_jitter'),
             'EXECUTION_CLOSE_MAX_RETRIES': ('execution', 'close_max_retries'),
             'EXECUTION_CLOSE_MAX_DURATION_SECONDS': ('execution', 'close_max_duration_seconds'),
             'EXECUTION_CLOSE_NO_PROGRESS_RETRIES': ('execution', 'close_no_progress_retries'),
@@ -157,46 +217,39 @@ class ConfigManager:
             'ALERTS_TELEGRAM_CHAT_ID': ('alerts', 'telegram_chat_id'),
         }
 
-        int_keys = {
-            'leverage',
-            'order_size_usdt',
-            'loop_interval',
-            'data_close_buffer_seconds',
-            'error_backoff_seconds',
-            'max_repeated_errors',
-            'repeated_error_window_seconds',
-            'orderbook_levels',
-            'max_slippage_bps',
-            'close_retry_interval_seconds',
-            'close_max_retries',
-            'close_max_duration_seconds',
-            'close_no_progress_retries',
-        }
-        float_keys = {
-            'risk_per_trade_pct',
-            'min_notional_safety_factor',
-            'liquidity_usage_pct',
-            'close_min_slice_qty',
-            'position_qty_tolerance',
-        }
-        bool_keys = {
-            'fail_closed',
-            'kill_switch',
-            'enabled',
-            'telegram_enabled',
-            'fail_halt_on_close_failure',
-        }
-
         for env_var, (section, key) in env_mapping.items():
             value = os.getenv(env_var)
             if value is not None:
-                if key in int_keys:
-                    value = int(value)
-                elif key in float_keys:
-                    value = float(value)
-                elif key in bool_keys:
-                    value = self._to_bool(value)
-                self.config[section][key] = value
+                self.config[section][key] = self._coerce(section, key, value)
+        self._invalidate_cache()
+
+    @classmethod
+    def _coerce(cls, section: str, key: str, value: Any) -> Any:
+        """
+        Convert value to the declared type for section.key.
+
+        Raises ValueError on bad input, including a fractional value for an int key.
+        """
+        if value is None:
+            return None
+        name = (section, key)
+        if name in cls._INT_KEYS:
+            return cls._to_int(section, key, value)
+        if name in cls._FLOAT_KEYS:
+            return float(value)
+        if name in cls._BOOL_KEYS:
+            return cls._to_bool(value)
+        return value
+
+    @staticmethod
+    def _to_int(section: str, key: str, value: Any) -> int:
+        """Convert whole-number values to int without truncating fractions."""
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError(f"Config {section}.{key} must be a whole number, got {value!r}")
+        return int(number)
 
     @staticmethod
     def _to_bool(value: Any) -> bool:
@@ -214,139 +267,158 @@ class ConfigManager:
                 self._merge_config(value, base=target[key])
                 continue
             target[key] = value
+
+        if base is None:
+            self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop memoized uppercase properties (call after mutating self.config directly)."""
+        for name in [name for name in self.__dict__ if name.isupper()]:
+            del self.__dict__[name]
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self.config.get(section, {}).get(key, default)
     
     def set(self, section: str, key: str, value: Any) -> None:
-        """Set a configuration value."""
+        """Set a configuration value, converting typed keys up front."""
+        value = self._coerce(section, key, value)
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
+        self._invalidate_cache()
     
-    # Convenience properties for backward compatibility
-    @property
+    # Convenience properties for backward compatibility. Values are memoized in the
+    # instance __dict__ on first read; set()/load_* drop them so the next read re-resolves.
+    @cached_property
     def GRVT_ENV(self) -> str:
         return self.get('grvt', 'env')
     
-    @property
+    @cached_property
     def GRVT_API_KEY(self) -> str:
         return self.get('grvt', 'api_key')
     
-    @property
+    @cached_property
     def GRVT_PRIVATE_KEY(self) -> str:
         return self.get('grvt', 'private_key')
     
-    @property
+    @cached_property
     def GRVT_TRADING_ACCOUNT_ID(self) -> str:
         return self.get('grvt', 'trading_account_id')
     
-    @property
+    @cached_property
     def GRVT_SUB_ACCOUNT_ID(self) -> str:
         return self.get('grvt', 'sub_account_id')
     
-    @property
+    @cached_property
     def SYMBOL(self) -> str:
         return self.get('trading', 'symbol')
     
-    @property
+    @cached_property
     def LEVERAGE(self) -> int:
         return self.get('trading', 'leverage')
     
-    @property
-    def ORDER_SIZE_USDT(self) -> int:
+    @cached_property
+    def ORDER_SIZE_USDT(self) -> float:
         return self.get('trading', 'order_size_usdt')
     
-    @property
+    @cached_property
     def MAIN_LOOP_INTERVAL(self) -> int:
         return self.get('trading', 'loop_interval')
 
-    @property
+    @cached_property
     def RISK_ACTIVE_TRACK(self) -> str:
         return self.get('risk', 'active_track')
 
-    @property
+    @cached_property
     def RISK_FAIL_CLOSED(self) -> bool:
         return bool(self.get('risk', 'fail_closed', True))
 
-    @property
+    @cached_property
     def RISK_KILL_SWITCH(self) -> bool:
         return bool(self.get('risk', 'kill_switch', False))
 
-    @property
+    @cached_property
     def RISK_PER_TRADE_PCT(self) -> float:
         return float(self.get('risk', 'risk_per_trade_pct', 0.25))
 
-    @property
+    @cached_property
     def DATA_CLOSE_BUFFER_SECONDS(self) -> int:
         return int(self.get('ops', 'data_close_buffer_seconds', 2))
 
-    @property
+    @cached_property
     def STATE_FILE(self) -> str:
         return str(self.get('ops', 'state_file', 'state/runtime_state.json'))
 
-    @property
+    @cached_property
     def LOCK_FILE(self) -> str:
         return str(self.get('ops', 'lock_file', 'state/runtime.lock'))
 
-    @property
+    @cached_property
     def ERROR_BACKOFF_SECONDS(self) -> int:
         return int(self.get('ops', 'error_backoff_seconds', 2))
 
-    @property
+    @cached_property
     def MAX_REPEATED_ERRORS(self) -> int:
         return int(self.get('ops', 'max_repeated_errors', 20))
 
-    @property
+    @cached_property
     def REPEATED_ERROR_WINDOW_SECONDS(self) -> int:
         return int(self.get('ops', 'repeated_error_window_seconds', 300))
 
-    @property
+    @cached_property
     def STARTUP_MISMATCH_POLICY(self) -> str:
         return str(self.get('ops', 'startup_mismatch_policy', 'adopt_continue'))
 
-    @property
+    @cached_property
     def EXECUTION_CLOSE_MODE(self) -> str:
         return str(self.get('execution', 'close_mode', 'reduce_only_twap_slice'))
 
-    @property
+    @cached_property
     def EXECUTION_LIQUIDITY_USAGE_PCT(self) -> float:
         return float(self.get('execution', 'liquidity_usage_pct', 0.20))
 
-    @property
+    @cached_property
     def EXECUTION_ORDERBOOK_LEVELS(self) -> int:
         return int(self.get('execution', 'orderbook_levels', 20))
 
-    @property
+    @cached_property
     def EXECUTION_MAX_SLIPPAGE_BPS(self) -> int:
         return int(self.get('execution', 'max_slippage_bps', 20))
 
-    @property
+    @cached_property
     def EXECUTION_CLOSE_MIN_SLICE_QTY(self) -> float:
         return float(self.get('execution', 'close_min_slice_qty', 0.01))
 
-    @property
+    @cached_property
     def EXECUTION_CLOSE_RETRY_INTERVAL_SECONDS(self) -> int:
         return int(self.get('execution', 'close_retry_interval_seconds', 2))
 
-    @property
+    @cached_property
+    def EXECUTION_CLOSE_RETRY_CAP_SECONDS(self) -> int:
+        return int(self.get('execution', 'close_retry_cap_seconds', 16))
+
+    @cached_property
+    def EXECUTION_CLOSE_RETRY_JITTER(self) -> bool:
+        return bool(self.get('execution', 'close_retry_jitter', True))
+
+    @cached_property
     def EXECUTION_CLOSE_MAX_RETRIES(self) -> int:
         return int(self.get('execution', 'close_max_retries', 20))
 
-    @property
+    @cached_property
     def EXECUTION_CLOSE_MAX_DURATION_SECONDS(self) -> int:
         return int(self.get('execution', 'close_max_duration_seconds', 90))
 
-    @property
+    @cached_property
     def EXECUTION_CLOSE_NO_PROGRESS_RETRIES(self) -> int:
         return int(self.get('execution', 'close_no_progress_retries', 3))
 
-    @property
+    @cached_property
     def EXECUTION_POSITION_QTY_TOLERANCE(self) -> float:
         return float(self.get('execution', 'position_qty_tolerance', 0.000001))
 
-    @property
+    @cached_property
     def EXECUTION_FAIL_HALT_ON_CLOSE_FAILURE(self) -> bool:
         return bool(self.get('execution', 'fail_halt_on_close_failure', True))
     
@@ -4,11 +4,18 @@ GRVT Executor - Order Execution and Exchange Interface.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import logging
 import os
+import random
 import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # Add parent directory to path to find pysdk when running from source checkout.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
@@ -16,6 +23,78 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 from pysdk.grvt_ccxt import GrvtCcxt
 from pysdk.grvt_ccxt_env import GrvtEnv
 
+from grvt_bot.core.book_stream import OrderBookStream
+from grvt_bot.core.risk import MarketLimitsCompiled, compile_market_limits
+
+# OS-entropy source so concurrent bot processes draw independent backoff delays.
+_RETRY_RNG = random.SystemRandom()
+
+# Used for a close slice when market metadata is unavailable (no min size, no rounding).
+_NO_MARKET_LIMITS = compile_market_limits({})
+
+
+def _section_get(config: Any, section: str, key: str, default: Any) -> Any:
+    """Best-effort section/key accessor for ConfigManager-like objects or nested dicts."""
+    if hasattr(config, "get"):
+        try:
+            return config.get(section, key, default)
+        except TypeError:
+            pass
+    if isinstance(config, dict):
+        return config.get(section, {}).get(key, default)
+    return default
+
+
+@dataclass(frozen=True)
+class CloseSettings:
+    """Clamped `execution.*` settings for one adaptive close, read in a single pass."""
+
+    tolerance: float
+    max_retries: int
+    max_duration_seconds: int
+    no_progress_retries: int
+    retry_interval_seconds: int
+    retry_cap_seconds: int
+    retry_jitter: bool
+    max_slippage_bps: int
+    liquidity_usage_pct: float
+    orderbook_levels: int
+    min_slice_qty: float
+
+    @classmethod
+    def from_config(cls, config: Any) -> "CloseSettings":
+        def get(key: str, default: Any) -> Any:
+            return _section_get(config, "execution", key, default)
+
+        interval = max(1, int(get("close_retry_interval_seconds", 2)))
+        return cls(
+            tolerance=float(get("position_qty_tolerance", 0.000001)),
+            max_retries=max(1, int(get("close_max_retries", 20))),
+            max_duration_seconds=max(1, int(get("close_max_duration_seconds", 90))),
+            no_progress_retries=max(1, int(get("close_no_progress_retries", 3))),
+            retry_interval_seconds=interval,
+            retry_cap_seconds=max(interval, int(get("close_retry_cap_seconds", 16))),
+            retry_jitter=bool(get("close_retry_jitter", True)),
+            max_slippage_bps=int(get("max_slippage_bps", 20)),
+            liquidity_usage_pct=min(max(float(get("liquidity_usage_pct", 0.20)), 0.01), 1.0),
+            orderbook_levels=max(1, int(get("orderbook_levels", 20))),
+            min_slice_qty=max(0.0, float(get("close_min_slice_qty", 0.01))),
+        )
+
+    def retry_delay(self, failures: int) -> float:
+        """
+        Truncated exponential backoff after the given number of consecutive failures.
+
+        The first retry waits retry_interval_seconds and each further failure doubles
+        it up to retry_cap_seconds. With retry_jitter the delay is drawn uniformly
+        from [0, backoff] ("full jitter").
+        """
+        exponent = min(max(failures, 1) - 1, 6)
+        backoff = min(self.retry_cap_seconds, self.retry_interval_seconds * (2 ** exponent))
+        if self.retry_jitter:
+            return _RETRY_RNG.uniform(0, backoff)
+        return float(backoff)
+
 
 class GRVTExecutor:
     """
@@ -24,6 +103,16 @@ class GRVTExecutor:
     Handles authentication, order placement, and position management.
     """
 
+    # Streamed books older than this fall back to REST (two book.s publish intervals).
+    BOOK_STREAM_MAX_AGE_SECONDS = 1.0
+    # Streamed tickers older than this fall back to a REST fetch_ticker.
+    TICKER_STREAM_MAX_AGE_SECONDS = 2.0
+    # get_reference_price reuses a quote this young for the same (symbol, side).
+    REFERENCE_PRICE_TTL_SECONDS = 0.2
+
+    # Ticker fields that carry a usable price, in order of preference.
+    PRICE_KEYS = ("last", "last_price", "close", "mark_price", "mark", "mid_price")
+
     def __init__(self, config: Any, logger: Optional[logging.Logger] = None):
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
@@ -34,8 +123,22 @@ class GRVTExecutor:
         self.sub_account_id = self._get_config("GRVT_SUB_ACCOUNT_ID")
         self.env_str = self._get_config("GRVT_ENV")
 
-        self.client: Optional[GrvtCcxt] = None
+        # Non-optional by construction: initialize_client() raises instead of leaving it unset,
+        # so hot paths use it directly without a per-call None check.
+        self.client: GrvtCcxt = None  # type: ignore[assignment]
         self._markets_cache: Dict[str, Dict[str, Any]] = {}
+        # symbol -> (markets dict it was built from, limits); same tagging for compiled limits
+        self._market_limits: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._compiled_limits: Dict[str, Tuple[Dict[str, Any], MarketLimitsCompiled]] = {}
+        # (symbol, side) -> (monotonic time fetched, reference price)
+        self._reference_prices: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._book_stream: Optional[OrderBookStream] = None
+        # Long-lived price subscription, separate from the per-close book stream.
+        self._ticker_stream: Optional[OrderBookStream] = None
+        # Ticker field that last yielded a price; tried first on the next call.
+        self._price_key: Optional[str] = None
+        # Monotonic client_order_id source; seeded from wall-clock ms so ids differ across restarts.
+        self._coid_counter = itertools.count(int(time.time_ns() // 1_000_000) & 0x7FFFFFFF)
         self.initialize_client()
 
     def _get_config(self, key: str) -> Any:
@@ -51,14 +154,15 @@ class GRVTExecutor:
 
     def _cfg_get(self, section: str, key: str, default: Any) -> Any:
         """Best-effort section/key config accessor with default fallback."""
-        if hasattr(self.config, "get"):
-            try:
-                return self.config.get(section, key, default)
-            except TypeError:
-                pass
-        if isinstance(self.config, dict):
-            return self.config.get(section, {}).get(key, default)
-        return default
+        return _section_get(self.config, section, key, default)
+
+    def next_client_order_id(self) -> str:
+        """Return a unique, strictly increasing numeric client_order_id."""
+        return str(next(self._coid_counter))
+
+    def reset_client_order_id(self, seed: int) -> None:
+        """Restart the client_order_id sequence from seed (mainly for deterministic tests)."""
+        self._coid_counter = itertools.count(int(seed) & 0x7FFFFFFF)
 
     @staticmethod
     def _to_float(value: Any) -> Optional[float]:
@@ -82,17 +186,20 @@ class GRVTExecutor:
     @staticmethod
     def _normalize_ticker_payload(response: Any) -> Dict[str, Any]:
         """Normalize ticker response into a single dict."""
-        if isinstance(response, list):
-            return response[0] if response and isinstance(response[0], dict) else {}
-
-        if isinstance(response, dict):
-            if isinstance(response.get("result"), list):
-                result = response["result"]
-                return result[0] if result and isinstance(result[0], dict) else {}
-            if isinstance(response.get("result"), dict):
-                return response["result"]
+        # Common GRVT shape first: {"result": [...]} or {"result": {...}}.
+        response_type = type(response)
+        if response_type is dict:
+            result = response.get("result")
+            result_type = type(result)
+            if result_type is list:
+                return result[0] if result and type(result[0]) is dict else {}
+            if result_type is dict:
+                return result
             return response
 
+        if response_type is list:
+            return response[0] if response and type(response[0]) is dict else {}
+
         return {}
 
     def initialize_client(self) -> None:
@@ -119,14 +226,12 @@ class GRVTExecutor:
     def get_account_summary(self) -> Optional[Dict[str, Any]]:
         """Fetch account summary for the sub-account."""
         try:
-            assert self.client is not None
             return self.client.fetch_balance()
         except Exception as exc:
             self.logger.error("Error fetching account summary: %s", exc)
             return None
 
     def _fetch_ticker_payload(self, symbol: str) -> Dict[str, Any]:
-        assert self.client is not None
         ticker_response = self.client.fetch_ticker(symbol)
         payload = self._normalize_ticker_payload(ticker_response)
         if not payload and isinstance(ticker_response, dict) and "info" in ticker_response:
@@ -142,73 +247,161 @@ class GRVTExecutor:
         - sell: best_bid
         - fallback: last_price -> mark_price
         """
+        key = (symbol, side)
+        cached = self._reference_prices.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.REFERENCE_PRICE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            payload = self._fetch_ticker_payload(symbol)
-            if not payload:
-                return None
+            price = self._reference_price_from_payload(self._fetch_ticker_payload(symbol), side)
+        except Exception as exc:
+            self.logger.error("Error fetching reference price for %s: %s", symbol, exc)
+            return None
+        if price is not None:
+            self._reference_prices[key] = (now, price)
+        return price
 
-            side = str(side).lower()
-            chain: List[str] = []
-            if side == "buy":
-                chain.extend(["best_ask_price", "ask", "bestAsk"])
-            elif side == "sell":
-                chain.extend(["best_bid_price", "bid", "bestBid"])
+    @classmethod
+    def _reference_price_from_payload(cls, payload: Dict[str, Any], side: str) -> Optional[float]:
+        if not payload:
+            return None
 
-            chain.extend(["last", "last_price", "close", "mark_price", "mark", "mid_price"])
+        side = str(side).lower()
+        chain: List[str] = []
+        if side == "buy":
+            chain.extend(["best_ask_price", "ask", "bestAsk"])
+        elif side == "sell":
+            chain.extend(["best_bid_price", "bid", "bestBid"])
 
-            for key in chain:
-                price = self._to_float(payload.get(key))
-                if price is not None:
-                    return price
+        chain.extend(["last", "last_price", "close", "mark_price", "mark", "mid_price"])
 
-            return None
-        except Exception as exc:
-            self.logger.error("Error fetching reference price for %s: %s", symbol, exc)
-            return None
+        for key in chain:
+            price = cls._to_float(payload.get(key))
+            if price is not None:
+                return price
+
+        return None
+
+    def fetch_account_snapshot(self, symbol: str, include_balance: bool = True) -> Dict[str, Any]:
+        """Synchronous entry point for fetch_account_snapshot_async."""
+        return asyncio.run(self.fetch_account_snapshot_async(symbol, include_balance=include_balance))
+
+    async def fetch_account_snapshot_async(
+        self,
+        symbol: str,
+        include_balance: bool = True,
+        order_book_levels: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch open position, ticker and (optionally) balance for symbol in one round trip.
+
+        GRVT has no combined endpoint, so the REST calls are issued concurrently.
+        Returns {"position": Optional[dict], "ticker": dict, "balance": Optional[dict]};
+        a failed ticker fetch yields an empty ticker. When order_book_levels is given
+        the close-path order book is fetched alongside and returned under "order_book".
+        """
+        calls = [
+            self._run_blocking(self.get_open_position, symbol),
+            self._run_blocking(self._fetch_ticker_payload, symbol),
+        ]
+        if include_balance:
+            calls.append(self._run_blocking(self.get_account_summary))
+        if order_book_levels is not None:
+            calls.append(self._run_blocking(self._close_order_book, symbol, order_book_levels))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        position, ticker = results[0], results[1]
+        if isinstance(position, BaseException):
+            self.logger.error("Error fetching position for %s: %s", symbol, position)
+            position = None
+        if isinstance(ticker, BaseException):
+            self.logger.error("Error fetching ticker for %s: %s", symbol, ticker)
+            ticker = {}
+        balance = results[2] if include_balance else None
+        if isinstance(balance, BaseException):
+            self.logger.error("Error fetching balance: %s", balance)
+            balance = None
+        snapshot = {
+            "position": position,
+            "ticker": ticker or {},
+            "balance": balance,
+        }
+        if order_book_levels is not None:
+            order_book = results[-1]
+            if isinstance(order_book, BaseException):
+                self.logger.error("Error fetching order book for %s: %s", symbol, order_book)
+                order_book = None
+            snapshot["order_book"] = order_book
+        return snapshot
 
     def get_market_price(self, symbol: str) -> float:
         """Get current market price for a symbol."""
         try:
-            payload = self._fetch_ticker_payload(symbol)
-            if payload:
-                for key in ("last", "last_price", "close", "mark_price", "mark", "mid_price"):
-                    price = self._to_float(payload.get(key))
-                    if price is not None:
-                        return price
+            payload = None
+            if self._ticker_stream is not None:
+                payload = self._ticker_stream.ticker(symbol, self.TICKER_STREAM_MAX_AGE_SECONDS)
+            if not payload:
+                payload = self._fetch_ticker_payload(symbol)
+            if not payload:
+                return 0.0
+
+            # The ticker schema is fixed per API version: reuse the key that worked last time.
+            price_key = self._price_key
+            if price_key is not None:
+                price = self._to_float(payload.get(price_key))
+                if price is not None:
+                    return price
+
+            for key in self.PRICE_KEYS:
+                price = self._to_float(payload.get(key))
+                if price is not None:
+                    self._price_key = key
+                    return price
             return 0.0
         except Exception as exc:
             self.logger.error("Error fetching ticker for %s: %s", symbol, exc)
             return 0.0
 
-    def _load_markets(self) -> Dict[str, Dict[str, Any]]:
-        assert self.client is not None
-
-        markets: Dict[str, Dict[str, Any]] = {}
+    def _markets_via_load(self) -> Dict[str, Dict[str, Any]]:
         try:
             loaded = self.client.load_markets()
             if isinstance(loaded, dict):
-                markets.update(loaded)
+                return dict(loaded)
         except Exception as exc:
             self.logger.warning("load_markets failed: %s", exc)
+        return {}
 
-        if not markets:
-            try:
-                fetched = self.client.fetch_markets()
-                if isinstance(fetched, list):
-                    markets = {
-                        str(item.get("instrument")): item
-                        for item in fetched
-                        if isinstance(item, dict) and item.get("instrument")
-                    }
-            except Exception as exc:
-                self.logger.warning("fetch_markets failed: %s", exc)
+    def _markets_via_fetch(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            fetched = self.client.fetch_markets()
+            if isinstance(fetched, list):
+                return {
+                    str(item.get("instrument")): item
+                    for item in fetched
+                    if isinstance(item, dict) and item.get("instrument")
+                }
+        except Exception as exc:
+            self.logger.warning("fetch_markets failed: %s", exc)
+        return {}
 
+    def _load_markets(self) -> Dict[str, Dict[str, Any]]:
+        """Load market metadata; fetch_markets is only called when load_markets fails or is empty."""
+        markets = self._markets_via_load() or self._markets_via_fetch()
         if markets:
             self._markets_cache = markets
         return self._markets_cache
 
     def get_market_limits(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get market metadata including min_qty (from min_size)."""
+        """
+        Get market metadata including min_qty (from min_size).
+
+        Cached per symbol until market metadata is reloaded; treat the result as read-only.
+        """
+        cached = self._market_limits.get(symbol)
+        if cached is not None and cached[0] is self._markets_cache:
+            return cached[1]
+
         try:
             markets = self._markets_cache or self._load_markets()
             market = markets.get(symbol) if isinstance(markets, dict) else None
@@ -224,17 +417,37 @@ class GRVTExecutor:
             except (TypeError, ValueError):
                 base_decimals = None
 
-            return {
+            limits = {
                 "symbol": symbol,
                 "min_qty": min_qty,
                 "tick_size": tick_size,
                 "base_decimals": base_decimals,
                 "raw": market,
             }
+            self._market_limits[symbol] = (markets, limits)
+            return limits
         except Exception as exc:
             self.logger.error("Error fetching market limits for %s: %s", symbol, exc)
             return None
 
+    def get_market_limits_compiled(self, symbol: str) -> Optional[MarketLimitsCompiled]:
+        """
+        Market limits compiled for RiskEngine.evaluate_entry, cached per symbol.
+
+        The cache entry is tagged with the markets dict it was built from, so a
+        market metadata reload invalidates it.
+        """
+        cached = self._compiled_limits.get(symbol)
+        if cached is not None and cached[0] is self._markets_cache:
+            return cached[1]
+
+        limits = self.get_market_limits(symbol)
+        if not limits:
+            return None
+        compiled = compile_market_limits(limits)
+        self._compiled_limits[symbol] = (self._markets_cache, compiled)
+        return compiled
+
     @staticmethod
     def _normalize_orderbook_levels(levels: Any) -> List[Tuple[float, float]]:
         normalized: List[Tuple[float, float]] = []
@@ -242,12 +455,17 @@ class GRVTExecutor:
             return normalized
 
         for level in levels:
-            if not isinstance(level, (list, tuple)) or len(level) < 2:
-                continue
             try:
-                price = float(level[0])
-                qty = float(level[1])
-            except (TypeError, ValueError):
+                if isinstance(level, (list, tuple)) and len(level) >= 2:
+                    price = float(level[0])
+                    qty = float(level[1])
+                elif isinstance(level, dict):
+                    # Raw GRVT level: {"price": ..., "size": ..., "num_orders": ...}
+                    price = float(level["price"])
+                    qty = float(level["size"])
+                else:
+                    continue
+            except (KeyError, TypeError, ValueError):
                 continue
             if price <= 0 or qty <= 0:
                 continue
@@ -257,7 +475,6 @@ class GRVTExecutor:
     def get_order_book(self, symbol: str, limit: int = 20) -> Optional[Dict[str, Any]]:
         """Fetch normalized orderbook (ccxt-like bids/asks)."""
         try:
-            assert self.client is not None
             limit = max(1, int(limit))
             try:
                 response = self.client.fetch_order_book(symbol, limit=limit)
@@ -279,6 +496,76 @@ class GRVTExecutor:
             self.logger.error("Error fetching order book for %s: %s", symbol, exc)
             return None
 
+    def _new_stream(self, **kwargs: Any) -> OrderBookStream:
+        return OrderBookStream(
+            self.env_str,
+            {
+                "api_key": self.api_key,
+                "trading_account_id": self.trading_account_id,
+                "private_key": self.private_key,
+            },
+            logger=logging.getLogger(f"{self.logger.name}.sdk"),
+            **kwargs,
+        )
+
+    def start_ticker_stream(self, symbol: str) -> bool:
+        """
+        Subscribe to the WebSocket mini ticker so get_market_price avoids a REST round trip.
+
+        Returns False (and get_market_price keeps using REST) when the stream cannot start.
+        """
+        if self._ticker_stream is None:
+            self._ticker_stream = self._new_stream()
+        started = self._ticker_stream.start_ticker(symbol)
+        if not started:
+            self.stop_ticker_stream()
+        return started
+
+    def stop_ticker_stream(self) -> None:
+        """Tear down the WebSocket ticker subscription, if any."""
+        if self._ticker_stream is not None:
+            self._ticker_stream.stop()
+            self._ticker_stream = None
+
+    def start_book_stream(self, symbol: str) -> bool:
+        """
+        Subscribe to the WebSocket order book for symbol.
+
+        Returns False (and REST polling stays in effect) when the stream cannot start.
+        """
+        if self._book_stream is None:
+            self._book_stream = self._new_stream(
+                depth=int(self._cfg_get("execution", "orderbook_levels", 20))
+            )
+        return self._book_stream.start(symbol)
+
+    def stop_book_stream(self) -> None:
+        """Tear down the WebSocket order book subscription, if any."""
+        if self._book_stream is not None:
+            self._book_stream.stop()
+            self._book_stream = None
+
+    @contextmanager
+    def book_stream(self, symbol: str, enabled: bool = True) -> Iterator[bool]:
+        """Keep a book stream open for the duration of the block when enabled."""
+        started = enabled and self.start_book_stream(symbol)
+        try:
+            yield started
+        finally:
+            if started:
+                self.stop_book_stream()
+
+    def _close_order_book(self, symbol: str, limit: int) -> Optional[Dict[str, Any]]:
+        """Prefer a fresh streamed book; fall back to REST when absent or stale."""
+        if self._book_stream is not None:
+            feed = self._book_stream.snapshot(symbol, self.BOOK_STREAM_MAX_AGE_SECONDS)
+            if feed is not None:
+                bids = self._normalize_orderbook_levels(feed.get("bids"))[:limit]
+                asks = self._normalize_orderbook_levels(feed.get("asks"))[:limit]
+                if bids or asks:
+                    return {"bids": bids, "asks": asks, "raw": feed}
+        return self.get_order_book(symbol, limit=limit)
+
     @staticmethod
     def _available_qty_in_band(
         order_book: Dict[str, Any],
@@ -315,7 +602,6 @@ class GRVTExecutor:
         Note: May be unsupported by API and need manual web configuration.
         """
         try:
-            assert self.client is not None
             self.logger.info("Attempting to set leverage %sx for %s", leverage, symbol)
             if hasattr(self.client, "set_leverage") and callable(self.client.set_leverage):
                 result = self.client.set_leverage(leverage, symbol)
@@ -324,10 +610,7 @@ class GRVTExecutor:
             self.logger.warning("set_leverage not available in client")
             return None
         except Exception as exc:
-            self.logger.error("Error setting leverage: %s", exc)
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error setting leverage: %s", exc)
             return None
 
     def get_current_leverage(self, symbol: Optional[str] = None) -> Optional[Any]:
@@ -335,7 +618,6 @@ class GRVTExecutor:
         Fetch leverage information when supported by the exchange client.
         """
         try:
-            assert self.client is not None
             params = {"sub_account_id": self.sub_account_id}
 
             if symbol:
@@ -372,10 +654,7 @@ class GRVTExecutor:
             self.logger.warning("Client does not expose leverage query methods")
             return None
         except Exception as exc:
-            self.logger.error("Error fetching leverage info: %s", exc)
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error fetching leverage info: %s", exc)
             return None
 
     def place_market_order(
@@ -393,7 +672,6 @@ class GRVTExecutor:
         client_order_id is forwarded to exchange for idempotency.
         """
         try:
-            assert self.client is not None
             req_params: Dict[str, Any] = {"sub_account_id": self.sub_account_id}
             if client_order_id is not None:
                 req_params["client_order_id"] = str(client_order_id)
@@ -409,10 +687,7 @@ class GRVTExecutor:
             )
             return self._handle_order_response(order, "market")
         except Exception as exc:
-            self.logger.error("Error placing market order: %s", exc)
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error placing market order: %s", exc)
             return None
 
     def place_limit_order(
@@ -427,7 +702,6 @@ class GRVTExecutor:
     ) -> Optional[Dict[str, Any]]:
         """Place a limit order."""
         try:
-            assert self.client is not None
             req_params: Dict[str, Any] = {"sub_account_id": self.sub_account_id}
             if client_order_id is not None:
                 req_params["client_order_id"] = str(client_order_id)
@@ -444,10 +718,7 @@ class GRVTExecutor:
             )
             return self._handle_order_response(order, "limit")
         except Exception as exc:
-            self.logger.error("Error placing limit order: %s", exc)
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error placing limit order: %s", exc)
             return None
 
     def _handle_order_response(
@@ -482,7 +753,6 @@ class GRVTExecutor:
     def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch positions for current sub-account."""
         try:
-            assert self.client is not None
             params = {"sub_account_id": self.sub_account_id}
             symbols = [symbol] if symbol else []
             try:
@@ -496,6 +766,28 @@ class GRVTExecutor:
             self.logger.error("Error fetching positions: %s", exc)
             return []
 
+    @staticmethod
+    def _extract_filled_qty(order: Dict[str, Any]) -> Optional[float]:
+        """
+        Filled base quantity reported in an order response, or None when absent.
+
+        Reads ccxt-style "filled" first, then GRVT's result.state.traded_size
+        (a per-leg list for multi-leg orders; the first leg is used).
+        """
+        filled = order.get("filled")
+        if filled is None:
+            result = order.get("result")
+            state = result.get("state") if isinstance(result, dict) else None
+            filled = state.get("traded_size") if isinstance(state, dict) else None
+            if isinstance(filled, (list, tuple)):
+                filled = filled[0] if filled else None
+        if filled is None:
+            return None
+        try:
+            return float(filled)
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def _extract_position_size(position: Dict[str, Any]) -> float:
         for key in ("contracts", "size", "position_size", "net_size", "qty", "quantity"):
@@ -552,6 +844,12 @@ class GRVTExecutor:
 
         return best
 
+    @staticmethod
+    async def _run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking REST call on the loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
     def close_position_adaptive(
         self,
         symbol: str,
@@ -560,23 +858,43 @@ class GRVTExecutor:
         *,
         config: Any,
         client_order_id_seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Synchronous entry point for close_position_adaptive_async.
+
+        Must not be called from a running event loop; await the async variant there.
+        """
+        return asyncio.run(
+            self.close_position_adaptive_async(
+                symbol,
+                side,
+                remaining_qty,
+                config=config,
+                client_order_id_seed=client_order_id_seed,
+            )
+        )
+
+    async def close_position_adaptive_async(
+        self,
+        symbol: str,
+        side: str,
+        remaining_qty: float,
+        *,
+        config: Any,
+        client_order_id_seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Close position with adaptive orderbook-aware reduce-only market slices.
 
         This flow is finite-state and always exits due to one of:
         success, retry cap, duration cap, or no-progress cap.
-        """
-        def cfg_get(section: str, key: str, default: Any) -> Any:
-            if hasattr(config, "get"):
-                try:
-                    return config.get(section, key, default)
-                except TypeError:
-                    pass
-            if isinstance(config, dict):
-                return config.get(section, {}).get(key, default)
-            return default
 
+        Retry waits use asyncio.sleep and exchange calls run in the default
+        executor, so other coroutines on the loop keep running during a close.
+
+        client_order_id_seed, when given, numbers this close's slices from seed
+        without touching the executor's shared client_order_id sequence.
+        """
         start_ts = time.time()
         attempts = 0
         orders_sent = 0
@@ -593,26 +911,34 @@ class GRVTExecutor:
                 "elapsed_seconds": 0.0,
             }
 
-        tolerance = float(cfg_get("execution", "position_qty_tolerance", 0.000001))
-        max_retries = int(cfg_get("execution", "close_max_retries", 20))
-        max_duration_seconds = int(cfg_get("execution", "close_max_duration_seconds", 90))
-        close_no_progress_retries = int(cfg_get("execution", "close_no_progress_retries", 3))
-        close_retry_interval_seconds = int(cfg_get("execution", "close_retry_interval_seconds", 2))
-        max_slippage_bps = int(cfg_get("execution", "max_slippage_bps", 20))
-        liquidity_usage_pct = float(cfg_get("execution", "liquidity_usage_pct", 0.20))
-        orderbook_levels = int(cfg_get("execution", "orderbook_levels", 20))
-        min_slice_qty = float(cfg_get("execution", "close_min_slice_qty", 0.01))
-
-        max_retries = max(1, max_retries)
-        max_duration_seconds = max(1, max_duration_seconds)
-        close_no_progress_retries = max(1, close_no_progress_retries)
-        close_retry_interval_seconds = max(1, close_retry_interval_seconds)
-        orderbook_levels = max(1, orderbook_levels)
-        liquidity_usage_pct = min(max(liquidity_usage_pct, 0.01), 1.0)
-        min_slice_qty = max(0.0, min_slice_qty)
+        settings = CloseSettings.from_config(config)
+        tolerance = settings.tolerance
+        max_retries = settings.max_retries
+        max_duration_seconds = settings.max_duration_seconds
+        close_no_progress_retries = settings.no_progress_retries
+        max_slippage_bps = settings.max_slippage_bps
+        liquidity_usage_pct = settings.liquidity_usage_pct
+        orderbook_levels = settings.orderbook_levels
+        min_slice_qty = settings.min_slice_qty
+        retry_delay = settings.retry_delay
+        settle_seconds = float(settings.retry_interval_seconds)
+        # Market limits do not change during a close; looked up until one succeeds.
+        compiled_limits: Optional[MarketLimitsCompiled] = None
 
         remaining_qty = max(0.0, float(remaining_qty))
         previous_remaining = remaining_qty
+        if client_order_id_seed is not None:
+            seeded_ids = itertools.count(int(client_order_id_seed) & 0x7FFFFFFF)
+
+            def next_client_order_id() -> str:
+                return str(next(seeded_ids))
+        else:
+            next_client_order_id = self.next_client_order_id
+
+        # Resolve the DEBUG check once; slice traces are skipped entirely at INFO and above.
+        log = self.logger
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        snapshot: Optional[Dict[str, Any]] = None
 
         while remaining_qty > tolerance:
             elapsed = time.time() - start_ts
@@ -635,7 +961,14 @@ class GRVTExecutor:
                     "elapsed_seconds": elapsed,
                 }
 
-            open_position = self.get_open_position(symbol)
+            if snapshot is None:
+                snapshot = await self.fetch_account_snapshot_async(
+                    symbol, include_balance=False, order_book_levels=orderbook_levels
+                )
+            open_position = snapshot["position"]
+            ticker = snapshot["ticker"]
+            order_book = snapshot["order_book"]
+            snapshot = None
             if not open_position:
                 return {
                     "success": True,
@@ -657,11 +990,14 @@ class GRVTExecutor:
                     "elapsed_seconds": elapsed,
                 }
             remaining_qty = live_qty
+            if previous_remaining - live_qty > tolerance:
+                # A late fill from an earlier slice still resets the failure backoff.
+                no_progress_retries = 0
+                previous_remaining = live_qty
             open_side = str(open_position.get("side", "")).lower()
             close_side = "sell" if open_side == "buy" else "buy"
 
-            reference_price = self.get_reference_price(symbol, close_side)
-            order_book = self.get_order_book(symbol, limit=orderbook_levels)
+            reference_price = self._reference_price_from_payload(ticker, close_side)
             if reference_price is None or reference_price <= 0 or not order_book:
                 attempts += 1
                 no_progress_retries += 1
@@ -674,7 +1010,7 @@ class GRVTExecutor:
                         "orders_sent": orders_sent,
                         "elapsed_seconds": time.time() - start_ts,
                     }
-                time.sleep(close_retry_interval_seconds)
+                await asyncio.sleep(retry_delay(no_progress_retries))
                 continue
 
             available_qty = self._available_qty_in_band(
@@ -695,7 +1031,7 @@ class GRVTExecutor:
                         "orders_sent": orders_sent,
                         "elapsed_seconds": time.time() - start_ts,
                     }
-                time.sleep(close_retry_interval_seconds)
+                await asyncio.sleep(retry_delay(no_progress_retries))
                 continue
 
             if available_qty >= remaining_qty:
@@ -704,11 +1040,11 @@ class GRVTExecutor:
                 target_qty = max(min_slice_qty, available_qty * liquidity_usage_pct)
                 target_qty = min(target_qty, remaining_qty)
 
-            limits = self.get_market_limits(symbol) or {}
-            min_qty_value = limits.get("min_qty")
-            min_qty = float(min_qty_value) if min_qty_value not in (None, "", 0) else 0.0
-            base_decimals = limits.get("base_decimals")
-            target_qty = self._apply_qty_precision(float(target_qty), base_decimals)
+            if compiled_limits is None:
+                compiled_limits = await self._run_blocking(self.get_market_limits_compiled, symbol)
+            slice_limits = compiled_limits or _NO_MARKET_LIMITS
+            min_qty = slice_limits.min_qty
+            target_qty = self._apply_qty_precision(float(target_qty), slice_limits.base_decimals)
 
             if target_qty <= tolerance:
                 attempts += 1
@@ -722,7 +1058,7 @@ class GRVTExecutor:
                         "orders_sent": orders_sent,
                         "elapsed_seconds": time.time() - start_ts,
                     }
-                time.sleep(close_retry_interval_seconds)
+                await asyncio.sleep(retry_delay(no_progress_retries))
                 continue
 
             if min_qty > 0 and target_qty < min_qty:
@@ -740,13 +1076,24 @@ class GRVTExecutor:
                             "orders_sent": orders_sent,
                             "elapsed_seconds": time.time() - start_ts,
                         }
-                    time.sleep(close_retry_interval_seconds)
+                    await asyncio.sleep(retry_delay(no_progress_retries))
                     continue
 
             attempts += 1
-            order_id_seed = int(time.time() * 1000) if client_order_id_seed is None else int(client_order_id_seed)
-            client_order_id = str((order_id_seed + attempts + orders_sent) % 2_147_483_647)
-            response = self.place_market_order(
+            client_order_id = next_client_order_id()
+            if debug_enabled:
+                log.debug(
+                    "Close slice attempt=%s symbol=%s side=%s qty=%s available=%s ref=%s coid=%s",
+                    attempts,
+                    symbol,
+                    close_side,
+                    target_qty,
+                    available_qty,
+                    reference_price,
+                    client_order_id,
+                )
+            response = await self._run_blocking(
+                self.place_market_order,
                 symbol=symbol,
                 side=close_side,
                 amount=float(target_qty),
@@ -754,8 +1101,11 @@ class GRVTExecutor:
                 client_order_id=client_order_id,
             )
 
+            reported_full_fill = False
             if response:
                 orders_sent += 1
+                filled_qty = self._extract_filled_qty(response)
+                reported_full_fill = filled_qty is not None and remaining_qty - filled_qty <= tolerance
             else:
                 no_progress_retries += 1
                 if no_progress_retries >= close_no_progress_retries:
@@ -768,13 +1118,29 @@ class GRVTExecutor:
                         "elapsed_seconds": time.time() - start_ts,
                     }
 
-            time.sleep(close_retry_interval_seconds)
-            latest_position = self.get_open_position(symbol)
+            # Fixed settle wait so the re-poll does not race the fill; backoff is for failures.
+            # A slice reported as filling the whole remainder skips the wait, but success
+            # is still only declared from the position poll below.
+            if not reported_full_fill:
+                await asyncio.sleep(settle_seconds)
+            # The post-slice snapshot also seeds the next iteration's position, ticker and book.
+            snapshot = await self.fetch_account_snapshot_async(
+                symbol, include_balance=False, order_book_levels=orderbook_levels
+            )
+            latest_position = snapshot["position"]
             latest_remaining = (
                 abs(float(latest_position.get("amount_base", 0.0)))
                 if latest_position
                 else 0.0
             )
+            if debug_enabled:
+                log.debug(
+                    "Close progress symbol=%s remaining=%s previous=%s no_progress=%s",
+                    symbol,
+                    latest_remaining,
+                    previous_remaining,
+                    no_progress_retries,
+                )
 
             if latest_remaining <= tolerance:
                 return {
@@ -831,12 +1197,14 @@ class GRVTExecutor:
             amount,
             close_side,
         )
-        result = self.close_position_adaptive(
-            symbol=symbol,
-            side=close_side,
-            remaining_qty=amount,
-            config=self.config,
-        )
+        use_stream = bool(self._cfg_get("execution", "close_use_book_stream", False))
+        with self.book_stream(symbol, enabled=use_stream):
+            result = self.close_position_adaptive(
+                symbol=symbol,
+                side=close_side,
+                remaining_qty=amount,
+                config=self.config,
+            )
         if not result.get("success"):
             self.logger.error(
                 "Adaptive flatten failed: code=%s remaining_qty=%s attempts=%s",
@@ -851,6 +1219,12 @@ class GRVTExecutor:
         """Backward-compatible alias for flatten_all_positions."""
         self.flatten_all_positions(symbol)
 
+    def _fetch_ohlcv_response(self, symbol: str, timeframe: str, limit: int) -> Any:
+        if not hasattr(self.client, "fetch_ohlcv"):
+            self.logger.error("Client does not support fetch_ohlcv")
+            return None
+        return self.client.fetch_ohlcv(symbol, timeframe, limit=limit)
+
     def fetch_ohlcv(self, symbol: str, timeframe: str = "1m", limit: int = 100) -> Any:
         """
         Fetch OHLCV (candlestick) data.
@@ -859,13 +1233,10 @@ class GRVTExecutor:
             List[ [timestamp_ms, open, high, low, close, volume], ... ]
         """
         try:
-            assert self.client is not None
-            if not hasattr(self.client, "fetch_ohlcv"):
-                self.logger.error("Client does not support fetch_ohlcv")
+            response = self._fetch_ohlcv_response(symbol, timeframe, limit)
+            if response is None:
                 return []
 
-            response = self.client.fetch_ohlcv(symbol, timeframe, limit=limit)
-
             if isinstance(response, dict) and "result" in response:
                 candidates = response["result"]
                 ohlcv_list = []
@@ -877,7 +1248,7 @@ class GRVTExecutor:
                     c_price = float(candle.get("close", 0))
                     volume = float(candle.get("volume", candle.get("volume_u", 0)))
                     ohlcv_list.append([ts_ms, o, h, l, c_price, volume])
-                ohlcv_list.sort(key=lambda x: x[0])
+                ohlcv_list.sort(key=itemgetter(0))
                 return ohlcv_list
 
             if isinstance(response, list):
@@ -886,8 +1257,56 @@ class GRVTExecutor:
             self.logger.warning("Unexpected OHLCV response format: %s", type(response))
             return []
         except Exception as exc:
-            self.logger.error("Error fetching OHLCV: %s", exc)
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("Error fetching OHLCV: %s", exc)
             return []
+
+    def fetch_ohlcv_array(self, symbol: str, timeframe: str = "1m", limit: int = 100) -> Any:
+        """
+        Fetch OHLCV data as a NumPy structured array sorted by open time.
+
+        Fields: ts (int64 ms), o, h, l, c, v (float64). Returns None on failure.
+        Requires numpy (installed alongside pandas for the indicator strategies).
+        """
+        import numpy as np
+
+        dtype = np.dtype(
+            [("ts", "i8"), ("o", "f8"), ("h", "f8"), ("l", "f8"), ("c", "f8"), ("v", "f8")]
+        )
+        try:
+            response = self._fetch_ohlcv_response(symbol, timeframe, limit)
+            if response is None:
+                return None
+
+            if isinstance(response, dict) and "result" in response:
+                candidates = response["result"]
+                arr = np.fromiter(
+                    (
+                        (
+                            int(candle.get("open_time", 0)),
+                            float(candle.get("open", 0)),
+                            float(candle.get("high", 0)),
+                            float(candle.get("low", 0)),
+                            float(candle.get("close", 0)),
+                            float(candle.get("volume", candle.get("volume_u", 0))),
+                        )
+                        for candle in candidates
+                    ),
+                    dtype=dtype,
+                    count=len(candidates),
+                )
+                arr["ts"] //= 1_000_000  # ns -> ms
+            elif isinstance(response, list):
+                arr = np.fromiter(
+                    (tuple(row[:6]) for row in response),
+                    dtype=dtype,
+                    count=len(response),
+                )
+            else:
+                self.logger.warning("Unexpected OHLCV response format: %s", type(response))
+                return None
+
+            arr.sort(order="ts")
+            return arr
+        except Exception as exc:
+            self.logger.exception("Error fetching OHLCV: %s", exc)
+            return None
@@ -5,13 +5,14 @@ Risk engine for entry gating and account-level threshold controls.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
 import logging
 
 
-@dataclass
+@dataclass(frozen=True)
 class RiskDecision:
-    """Result of a risk evaluation."""
+    """Result of a risk evaluation (immutable; shared instances are safe to hand out)."""
 
     allowed: bool
     code: str
@@ -20,7 +21,77 @@ class RiskDecision:
     order_qty: Optional[float] = None
     order_notional_usdt: Optional[float] = None
     derived_min_notional_usdt: Optional[float] = None
-    meta: Dict[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=dict)
+
+
+def _as_float(value: Any) -> Any:
+    """float(value), skipped for values that already are floats; None passes through."""
+    if value is None or type(value) is float:
+        return value
+    return float(value)
+
+
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
+
+# Shared result for the common "no threshold hit" case.
+_OK_DECISION = RiskDecision(True, "OK", "Threshold checks passed", meta=_EMPTY_META)
+
+# side_idx values for RiskEngine.evaluate_entry_fast.
+SIDE_INDEX: Mapping[str, int] = MappingProxyType({"buy": 0, "sell": 1})
+_SIDES = ("buy", "sell")
+
+
+@dataclass(frozen=True)
+class MarketLimitsCompiled:
+    """
+    Market limits pre-validated for entry checks.
+
+    min_qty is 0.0 when metadata is missing or invalid; min_qty_issue then holds
+    the (code, reason) that fail-closed entry checks reject with.
+    """
+
+    min_qty: float
+    base_decimals: Optional[int]
+    min_qty_issue: Optional[Tuple[str, str]] = None
+
+
+def compile_market_limits(market_limits: Dict[str, Any]) -> MarketLimitsCompiled:
+    """Cast and validate executor market limits once for repeated evaluate_entry calls."""
+    base_decimals = market_limits.get("base_decimals")
+    if base_decimals is not None:
+        try:
+            base_decimals = max(0, int(base_decimals))
+        except (TypeError, ValueError):
+            base_decimals = None
+
+    min_qty_value = market_limits.get("min_qty")
+    if min_qty_value is None or min_qty_value == "" or (
+        min_qty_value == 0 and type(min_qty_value) is not bool
+    ):
+        return MarketLimitsCompiled(
+            0.0,
+            base_decimals,
+            ("MIN_QTY_MISSING", "min_qty missing from exchange metadata"),
+        )
+    try:
+        # bool is an int subclass; True must not pass as min_qty=1.0.
+        min_qty = 0.0 if type(min_qty_value) is bool else float(min_qty_value)
+    except (TypeError, ValueError):
+        min_qty = 0.0
+    if min_qty <= 0:
+        return MarketLimitsCompiled(
+            0.0,
+            base_decimals,
+            ("MIN_QTY_INVALID", f"Invalid min_qty={min_qty_value}"),
+        )
+    return MarketLimitsCompiled(min_qty, base_decimals)
+
+
+class TrackThresholds(NamedTuple):
+    """Drawdown/profit thresholds (percent) of a risk track."""
+
+    max_drawdown_pct: float
+    profit_target_pct: float
 
 
 class RiskEngine:
@@ -29,43 +100,69 @@ class RiskEngine:
     def __init__(self, config: Any, logger: Optional[logging.Logger] = None):
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
+        self._config_get = config.get if hasattr(config, "get") else None
+        self.refresh()
 
     def _get(self, section: str, key: str, default: Any = None) -> Any:
-        if hasattr(self.config, "get"):
-            return self.config.get(section, key, default)
+        config_get = self._config_get
+        if config_get is not None:
+            return config_get(section, key, default)
         return default
 
+    def refresh(self) -> None:
+        """
+        Re-read risk settings from config.
+
+        Settings are cached at construction; call this after changing the config
+        (e.g. ConfigManager.set) for the new values to take effect.
+        """
+        self._fail_closed = bool(self._get("risk", "fail_closed", True))
+        self._kill_switch = bool(self._get("risk", "kill_switch", False))
+        self._active_track = str(self._get("risk", "active_track", "normal"))
+        self._threshold_action = str(self._get("risk", "threshold_action", "flatten_halt"))
+        self._risk_per_trade_pct = float(self._get("risk", "risk_per_trade_pct", 0.25))
+        self._min_notional_safety_factor = float(
+            self._get("risk", "min_notional_safety_factor", 1.05)
+        )
+        self._tracks: Dict[str, Any] = self._get("risk", "tracks", {}) or {}
+        self._track_cache: Dict[str, TrackThresholds] = {}
+
     @property
     def fail_closed(self) -> bool:
-        return bool(self._get("risk", "fail_closed", True))
+        return self._fail_closed
 
     @property
     def kill_switch(self) -> bool:
-        return bool(self._get("risk", "kill_switch", False))
+        return self._kill_switch
 
     @property
     def active_track(self) -> str:
-        return str(self._get("risk", "active_track", "normal"))
+        return self._active_track
 
     @property
     def threshold_action(self) -> str:
-        return str(self._get("risk", "threshold_action", "flatten_halt"))
+        return self._threshold_action
 
     @property
     def risk_per_trade_pct(self) -> float:
-        return float(self._get("risk", "risk_per_trade_pct", 0.25))
+        return self._risk_per_trade_pct
 
     @property
     def min_notional_safety_factor(self) -> float:
-        return float(self._get("risk", "min_notional_safety_factor", 1.05))
-
-    def _active_track_config(self) -> Dict[str, float]:
-        tracks = self._get("risk", "tracks", {}) or {}
-        active = tracks.get(self.active_track) or tracks.get("normal") or {}
-        return {
-            "max_drawdown_pct": float(active.get("max_drawdown_pct", 5.0)),
-            "profit_target_pct": float(active.get("profit_target_pct", 5.0)),
-        }
+        return self._min_notional_safety_factor
+
+    def _active_track_config(self) -> TrackThresholds:
+        name = self.active_track
+        cached = self._track_cache.get(name)
+        if cached is None:
+            tracks = self._tracks
+            active = tracks.get(name) or tracks.get("normal") or {}
+            cached = TrackThresholds(
+                max_drawdown_pct=float(active.get("max_drawdown_pct", 5.0)),
+                profit_target_pct=float(active.get("profit_target_pct", 5.0)),
+            )
+            self._track_cache[name] = cached
+        return cached
 
     def compute_notional_from_risk(
         self,
@@ -78,14 +175,14 @@ class RiskEngine:
 
         If strategy provides its own amount, cap by the risk-derived notional.
         """
-        leverage = max(1.0, float(leverage))
-        equity = max(0.0, float(account_equity_usdt))
+        leverage = max(1.0, _as_float(leverage))
+        equity = max(0.0, _as_float(account_equity_usdt))
         risk_notional = equity * (self.risk_per_trade_pct / 100.0) * leverage
 
         if signal_amount_usdt is None:
             return risk_notional
 
-        signal_amount_usdt = float(signal_amount_usdt)
+        signal_amount_usdt = _as_float(signal_amount_usdt)
         if signal_amount_usdt <= 0:
             return risk_notional
 
@@ -96,8 +193,14 @@ class RiskEngine:
         self,
         current_equity_usdt: Optional[float],
         baseline_equity_usdt: Optional[float],
+        want_meta: bool = False,
     ) -> RiskDecision:
-        """Check drawdown/profit threshold for Flatten+Halt policy."""
+        """
+        Check drawdown/profit threshold for Flatten+Halt policy.
+
+        When no threshold is hit a shared (frozen) OK decision is returned;
+        pass want_meta=True to get a fresh decision carrying pnl_pct instead.
+        """
         if current_equity_usdt is None or baseline_equity_usdt is None:
             if self.fail_closed:
                 return RiskDecision(
@@ -108,8 +211,8 @@ class RiskEngine:
                 )
             return RiskDecision(allowed=True, code="EQUITY_DATA_MISSING", reason="skip")
 
-        baseline = float(baseline_equity_usdt)
-        current = float(current_equity_usdt)
+        baseline = _as_float(baseline_equity_usdt)
+        current = _as_float(current_equity_usdt)
         if baseline <= 0 or current <= 0:
             if self.fail_closed:
                 return RiskDecision(
@@ -120,10 +223,9 @@ class RiskEngine:
                 )
             return RiskDecision(allowed=True, code="EQUITY_DATA_INVALID", reason="skip")
 
-        track = self._active_track_config()
-        max_drawdown_pct = float(track["max_drawdown_pct"])
-        profit_target_pct = float(track["profit_target_pct"])
-        pnl_pct = ((current - baseline) / baseline) * 100.0
+        max_drawdown_pct, profit_target_pct = self._active_track_config()
+        pct_per_usdt = 100.0 / baseline
+        pnl_pct = (current - baseline) * pct_per_usdt
 
         if pnl_pct <= -max_drawdown_pct:
             return RiskDecision(
@@ -143,6 +245,8 @@ class RiskEngine:
                 meta={"pnl_pct": pnl_pct, "baseline_equity_usdt": baseline, "current_equity_usdt": current},
             )
 
+        if not want_meta:
+            return _OK_DECISION
         return RiskDecision(
             allowed=True,
             code="OK",
@@ -155,12 +259,20 @@ class RiskEngine:
         side: str,
         amount_usdt: Optional[float],
         reference_price: Optional[float],
-        market_limits: Optional[Dict[str, Any]],
+        market_limits: Union[MarketLimitsCompiled, Dict[str, Any], None],
         is_halted: bool,
         account_equity_usdt: Optional[float] = None,
         leverage: Optional[float] = None,
     ) -> RiskDecision:
-        """Evaluate whether entry should proceed."""
+        """
+        Evaluate whether entry should proceed.
+
+        Numeric inputs are expected as floats (ints/numeric strings are still
+        converted); float values are used without re-casting.
+
+        market_limits may be the executor's raw limits dict or a MarketLimitsCompiled
+        (see GRVTExecutor.get_market_limits_compiled) to skip re-validation per call.
+        """
         side = str(side).lower()
         if side not in {"buy", "sell"}:
             return RiskDecision(False, "INVALID_SIDE", f"Unsupported side: {side}", action="skip")
@@ -171,7 +283,8 @@ class RiskEngine:
         if is_halted:
             return RiskDecision(False, "HALTED", "Bot is halted", action="skip")
 
-        if reference_price is None or float(reference_price) <= 0:
+        reference_price = _as_float(reference_price)
+        if reference_price is None or reference_price <= 0:
             return RiskDecision(
                 False,
                 "REFERENCE_PRICE_MISSING",
@@ -188,7 +301,7 @@ class RiskEngine:
                     action="skip",
                 )
             amount_usdt = self.compute_notional_from_risk(account_equity_usdt, leverage)
-        amount_usdt = float(amount_usdt)
+        amount_usdt = _as_float(amount_usdt)
 
         if amount_usdt <= 0:
             return RiskDecision(False, "INVALID_NOTIONAL", f"amount_usdt={amount_usdt}", action="skip")
@@ -203,29 +316,23 @@ class RiskEngine:
                 )
             return RiskDecision(True, "MARKET_LIMITS_MISSING", "Proceeding without market limits")
 
-        min_qty_value = market_limits.get("min_qty")
-        if min_qty_value in (None, "", 0):
-            if self.fail_closed:
-                return RiskDecision(
-                    False,
-                    "MIN_QTY_MISSING",
-                    "min_qty missing from exchange metadata",
-                    action="skip",
-                )
-            min_qty = 0.0
-        else:
-            min_qty = float(min_qty_value)
-            if min_qty <= 0:
-                if self.fail_closed:
-                    return RiskDecision(
-                        False,
-                        "MIN_QTY_INVALID",
-                        f"Invalid min_qty={min_qty}",
-                        action="skip",
-                    )
-                min_qty = 0.0
-
-        reference_price = float(reference_price)
+        compiled = (
+            market_limits
+            if isinstance(market_limits, MarketLimitsCompiled)
+            else compile_market_limits(market_limits)
+        )
+        if compiled.min_qty_issue is not None and self.fail_closed:
+            code, reason = compiled.min_qty_issue
+            return RiskDecision(False, code, reason, action="skip")
+        return self._entry_qty_decision(amount_usdt, reference_price, compiled)
+
+    def _entry_qty_decision(
+        self,
+        amount_usdt: float,
+        reference_price: float,
+        compiled: MarketLimitsCompiled,
+    ) -> RiskDecision:
+        """Quantity, min-qty and min-notional checks shared by both entry evaluations."""
         computed_qty = amount_usdt / reference_price
         if computed_qty <= 0:
             return RiskDecision(
@@ -235,15 +342,11 @@ class RiskEngine:
                 action="skip",
             )
 
-        base_decimals = market_limits.get("base_decimals")
-        if base_decimals is not None:
-            try:
-                precision = max(0, int(base_decimals))
-                computed_qty = round(computed_qty, precision)
-            except (TypeError, ValueError):
-                pass
+        if compiled.base_decimals is not None:
+            computed_qty = round(computed_qty, compiled.base_decimals)
 
-        if min_qty > 0 and computed_qty < min_qty:
+        min_qty = compiled.min_qty
+        if min_qty and computed_qty < min_qty:
             return RiskDecision(
                 False,
                 "MIN_QTY_VIOLATION",
@@ -252,7 +355,7 @@ class RiskEngine:
                 order_qty=computed_qty,
             )
 
-        derived_min_notional = min_qty * reference_price * self.min_notional_safety_factor if min_qty > 0 else 0.0
+        derived_min_notional = min_qty * reference_price * self._min_notional_safety_factor
         if derived_min_notional > 0 and amount_usdt < derived_min_notional:
             return RiskDecision(
                 False,
@@ -273,3 +376,30 @@ class RiskEngine:
             derived_min_notional_usdt=derived_min_notional,
             meta={"min_qty": min_qty, "reference_price": reference_price},
         )
+
+    def evaluate_entry_fast(
+        self,
+        side_idx: int,
+        amount_usdt: float,
+        reference_price: float,
+        compiled: MarketLimitsCompiled,
+        is_halted: bool,
+    ) -> RiskDecision:
+        """
+        Steady-state entry check for callers that already hold clean inputs.
+
+        side_idx comes from SIDE_INDEX, amounts are floats and market limits are
+        precompiled. Once the cheap guards pass, the decision comes from the same
+        quantity checks evaluate_entry uses; otherwise it falls back to evaluate_entry
+        for the detailed deny.
+        """
+        if (
+            not self._kill_switch
+            and not is_halted
+            and amount_usdt > 0
+            and reference_price > 0
+            and compiled.min_qty_issue is None
+        ):
+            return self._entry_qty_decision(amount_usdt, reference_price, compiled)
+        side = _SIDES[side_idx]
+        return self.evaluate_entry(side, amount_usdt, reference_price, compiled, is_halted)
@@ -4,6 +4,7 @@ Single-instance runtime lock for bot process.
 
 from __future__ import annotations
 
+import asyncio
 import errno
 import json
 import logging
@@ -13,18 +14,58 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+_LOCK_ENCODER = json.JSONEncoder(ensure_ascii=True, indent=2, sort_keys=True)
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _try_lock_fd(fd: int) -> bool:
+    """Take a non-blocking exclusive OS lock on fd; False when another process holds it."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError as exc:
+        if isinstance(exc, BlockingIOError) or exc.errno in (errno.EACCES, errno.EAGAIN):
+            return False
+        raise
+
+
+def _unlock_fd(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
 class RuntimeLock:
-    """File-based process lock to prevent multiple bot instances."""
+    """
+    File-based process lock to prevent multiple bot instances.
+
+    Exclusivity comes from an OS lock (flock, or msvcrt.locking on Windows) held
+    on the lock file for the process lifetime; the JSON payload (pid, start time,
+    command) is informational, plus a fallback for lock files left by holders
+    that did not take the OS lock.
+    """
 
     def __init__(self, lock_path: str, logger: Optional[logging.Logger] = None):
         self.path = Path(lock_path)
         self.logger = logger or logging.getLogger(__name__)
         self.acquired = False
+        self._fd: Optional[int] = None
 
     @staticmethod
     def _is_pid_alive(pid: int) -> bool:
@@ -55,51 +96,126 @@ class RuntimeLock:
         except Exception:
             return None
 
+    @staticmethod
+    def _read_fd_payload(fd: int) -> Optional[Dict[str, Any]]:
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            chunks = []
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            payload = json.loads(b"".join(chunks).decode("utf-8"))
+            return payload if isinstance(payload, dict) else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _payload_pid(payload: Optional[Dict[str, Any]]) -> int:
+        try:
+            return int((payload or {}).get("pid"))
+        except (TypeError, ValueError):
+            return 0
+
+    def _running_error(self, pid: int) -> RuntimeError:
+        return RuntimeError(
+            f"Another bot instance is running (pid={pid}). "
+            f"Remove stale lock only if you are sure process is dead: {self.path}"
+        )
+
+    def _open_locked_fd(self) -> int:
+        """Open the lock file and take the OS lock on it, or raise if it is held elsewhere."""
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if not _try_lock_fd(fd):
+                    pid = self._payload_pid(self._read_lock_payload())
+                    raise self._running_error(pid)
+                # The previous holder may have unlinked the file between our open and lock;
+                # only the inode currently at self.path counts.
+                try:
+                    current_ino = os.stat(self.path).st_ino
+                except FileNotFoundError:
+                    current_ino = None
+                if current_ino == os.fstat(fd).st_ino:
+                    return fd
+                _unlock_fd(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
     def acquire(self) -> None:
         """
         Acquire lock file or raise RuntimeError if another instance is alive.
         """
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = self._read_lock_payload()
         current_pid = os.getpid()
+        fd = self._open_locked_fd()
 
-        if payload:
-            existing_pid_raw = payload.get("pid")
-            try:
-                existing_pid = int(existing_pid_raw)
-            except (TypeError, ValueError):
-                existing_pid = 0
-
+        try:
+            existing_pid = self._payload_pid(self._read_fd_payload(fd))
             if existing_pid > 0 and existing_pid != current_pid and self._is_pid_alive(existing_pid):
-                raise RuntimeError(
-                    f"Another bot instance is running (pid={existing_pid}). "
-                    f"Remove stale lock only if you are sure process is dead: {self.path}"
-                )
-
-        data = {
-            "pid": current_pid,
-            "started_at": _utc_now_iso(),
-            "command": " ".join(sys.argv),
-        }
-        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=True, indent=2, sort_keys=True)
-        tmp.replace(self.path)
+                raise self._running_error(existing_pid)
+
+            data = {
+                "pid": current_pid,
+                "started_at": _utc_now_iso(),
+                "command": " ".join(sys.argv),
+            }
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, _LOCK_ENCODER.encode(data).encode("utf-8"))
+        except BaseException:
+            _unlock_fd(fd)
+            os.close(fd)
+            raise
+
+        self._fd = fd
         self.acquired = True
         self.logger.info("Runtime lock acquired: %s (pid=%s)", self.path, current_pid)
 
+    async def acquire_async(self, timeout: float, poll_interval: float = 0.05) -> None:
+        """
+        Wait up to timeout seconds for the lock without blocking the event loop.
+
+        Each attempt is a single non-blocking lock call; between attempts the
+        coroutine yields via asyncio.sleep. Raises RuntimeError on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, float(timeout))
+        while True:
+            try:
+                self.acquire()
+                return
+            except RuntimeError:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise
+                await asyncio.sleep(min(poll_interval, remaining))
+
     def release(self) -> None:
         """Release lock when owned by this process."""
         if not self.acquired:
             return
 
+        fd = self._fd
         try:
-            payload = self._read_lock_payload() or {}
-            file_pid = int(payload.get("pid", -1))
-            if file_pid == os.getpid() and self.path.exists():
+            if fcntl is not None:
+                # Unlink while still holding the lock; waiters re-check the inode.
+                self.path.unlink()
+            if fd is not None:
+                _unlock_fd(fd)
+                os.close(fd)
+                fd = None
+            if fcntl is None:
                 self.path.unlink()
-                self.logger.info("Runtime lock released: %s", self.path)
+            self.logger.info("Runtime lock released: %s", self.path)
         except Exception as exc:
             self.logger.warning("Failed to release runtime lock %s: %s", self.path, exc)
         finally:
+            if fd is not None:
+                os.close(fd)
+            self._fd = None
             self.acquired = False
@@ -4,18 +4,50 @@ State persistence and exchange reconciliation.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None  # type: ignore[assignment]
+
+
+# Reused for the stdlib fallback; json.dumps would build a new encoder per call.
+_STATE_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True)
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _dumps_state(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # e.g. non-str keys; let stdlib json coerce them
+    return _STATE_ENCODER.encode(data).encode("utf-8")
+
+
+def _loads_state(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity written by older versions
+    return json.loads(raw.decode("utf-8"))
+
+
 @dataclass
 class ReconcileResult:
     """Result of state reconciliation against exchange position."""
@@ -28,11 +60,30 @@ class ReconcileResult:
 
 
 class StateStore:
-    """Simple JSON-backed state for runtime recovery."""
+    """
+    Simple JSON-backed state for runtime recovery.
+
+    The last loaded/saved state is mirrored in memory: load() only reads disk
+    once, and save() skips the write when nothing but updated_at would change.
+    The set_* helpers update the mirror and write at most once per
+    SAVE_DEBOUNCE_SECONDS; call flush() to persist pending changes. Halt
+    changes are written immediately, together with anything still pending.
+    """
+
+    # Unchanged saves still refresh updated_at on disk at most this often.
+    UPDATED_AT_REFRESH_SECONDS = 60.0
+    # Minimum spacing between writes triggered by the set_* helpers.
+    SAVE_DEBOUNCE_SECONDS = 0.25
+    # Fields that must survive a crash right after being set; never debounced.
+    IMMEDIATE_FIELDS = frozenset({"halted", "halt_reason"})
 
     def __init__(self, state_path: str, logger: Optional[logging.Logger] = None):
         self.path = Path(state_path)
         self.logger = logger or logging.getLogger(__name__)
+        self._cached_state: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._last_write_monotonic = 0.0
+        self._writer: Optional[ThreadPoolExecutor] = None
 
     @staticmethod
     def default_state() -> Dict[str, Any]:
@@ -52,15 +103,17 @@ class StateStore:
         }
 
     def load(self) -> Dict[str, Any]:
-        """Load state from disk or initialize default state."""
+        """Load state from the in-memory mirror, disk (first call), or initialize defaults."""
+        if self._cached_state is not None:
+            return copy.deepcopy(self._cached_state)
+
         if not self.path.exists():
             state = self.default_state()
             self.save(state)
             return state
 
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                state = json.load(f)
+            state = _loads_state(self.path.read_bytes())
         except Exception as exc:
             self.logger.error("Failed reading state file %s: %s", self.path, exc)
             state = self.default_state()
@@ -69,74 +122,136 @@ class StateStore:
 
         default_state = self.default_state()
         default_state.update(state if isinstance(state, dict) else {})
+        self._cached_state = copy.deepcopy(default_state)
         return default_state
 
+    def _unchanged(self, state: Dict[str, Any]) -> bool:
+        cached = self._cached_state
+        if cached is None or len(cached) != len(state):
+            return False
+        for key, value in state.items():
+            if key != "updated_at" and (key not in cached or cached[key] != value):
+                return False
+        return True
+
     def save(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Persist state atomically."""
+        """Persist state atomically; unchanged state is not rewritten."""
+        if (
+            not self._dirty
+            and self._unchanged(state)
+            and time.monotonic() - self._last_write_monotonic < self.UPDATED_AT_REFRESH_SECONDS
+        ):
+            return self.load()
+        return self._write(state)
+
+    def save_async(self, state: Dict[str, Any]) -> "asyncio.Future[Dict[str, Any]]":
+        """
+        save() on a dedicated writer thread; await the result from a coroutine.
+
+        state is snapshotted and queued at call time. The writer has a single
+        worker, so saves hit the disk in call order and the last call wins.
+        """
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grvt-state-writer")
+        future = self._writer.submit(self.save, copy.deepcopy(state))
+        return asyncio.wrap_future(future, loop=asyncio.get_running_loop())
+
+    @property
+    def dirty(self) -> bool:
+        """True when set_* changes are held in memory and not yet on disk."""
+        return self._dirty
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Write pending set_* changes to disk (e.g. end of loop or shutdown)."""
+        if not self._dirty or self._cached_state is None:
+            return None
+        return self._write(self._cached_state)
+
+    def _write(self, state: Dict[str, Any]) -> Dict[str, Any]:
         data = dict(state)
         data["updated_at"] = _utc_now_iso()
 
         self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=True, indent=2, sort_keys=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps_state(data))
         tmp_path.replace(self.path)
+        self._cached_state = copy.deepcopy(data)
+        self._last_write_monotonic = time.monotonic()
+        self._dirty = False
         return data
 
+    def _set_fields(self, **fields: Any) -> Dict[str, Any]:
+        if self._cached_state is None:
+            self.load()
+        cached = self._cached_state
+        assert cached is not None
+
+        changed = [key for key, value in fields.items() if key not in cached or cached[key] != value]
+        if changed:
+            cached.update(copy.deepcopy(fields))
+            self._dirty = True
+            if (
+                not self.IMMEDIATE_FIELDS.isdisjoint(changed)
+                or time.monotonic() - self._last_write_monotonic >= self.SAVE_DEBOUNCE_SECONDS
+            ):
+                self._write(cached)
+        return copy.deepcopy(cached)
+
     def set_halted(self, halted: bool, reason: str = "") -> Dict[str, Any]:
-        state = self.load()
-        state["halted"] = bool(halted)
-        state["halt_reason"] = str(reason or "")
-        return self.save(state)
+        return self._set_fields(halted=bool(halted), halt_reason=str(reason or ""))
 
     def set_open_position(self, position: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        state = self.load()
-        state["open_position"] = position
-        return self.save(state)
+        return self._set_fields(open_position=position)
 
     def set_last_candle_open_time_ms(self, ts_ms: Optional[int]) -> Dict[str, Any]:
-        state = self.load()
-        state["last_candle_open_time_ms"] = ts_ms
-        return self.save(state)
+        return self._set_fields(last_candle_open_time_ms=ts_ms)
 
     def set_baseline_equity(self, equity_usdt: Optional[float]) -> Dict[str, Any]:
-        state = self.load()
-        state["baseline_equity_usdt"] = equity_usdt
-        return self.save(state)
+        return self._set_fields(baseline_equity_usdt=equity_usdt)
 
     @staticmethod
+    def _position_key(
+        position: Optional[Dict[str, Any]],
+        qty_tol: float = 1e-9,
+    ) -> Optional[Tuple[str, int]]:
+        """Comparable (side, qty in qty_tol units) key; None for no position."""
+        if not position:
+            return None
+        side = str(position.get("side", "")).lower()
+        return side, round(float(position.get("amount_base", 0.0)) / qty_tol)
+
+    @classmethod
     def _positions_mismatch(
+        cls,
         local_position: Optional[Dict[str, Any]],
         exchange_position: Optional[Dict[str, Any]],
         qty_tol: float = 1e-9,
     ) -> bool:
-        if not local_position and not exchange_position:
-            return False
-        if bool(local_position) != bool(exchange_position):
-            return True
-
-        assert local_position is not None
-        assert exchange_position is not None
-
-        local_side = str(local_position.get("side", "")).lower()
-        exchange_side = str(exchange_position.get("side", "")).lower()
-        if local_side != exchange_side:
-            return True
-
-        local_qty = float(local_position.get("amount_base", 0.0))
-        exchange_qty = float(exchange_position.get("amount_base", 0.0))
-        return abs(local_qty - exchange_qty) > qty_tol
+        return cls._position_key(local_position, qty_tol) != cls._position_key(
+            exchange_position, qty_tol
+        )
 
-    def reconcile(self, executor: Any, symbol: str) -> ReconcileResult:
+    def reconcile(
+        self,
+        executor: Any,
+        symbol: str,
+        snapshot: Optional[Dict[str, Any]] = None,
+    ) -> ReconcileResult:
         """
         Reconcile local state with live exchange position.
 
-        Exchange is treated as source of truth.
+        Exchange is treated as source of truth. When snapshot (from
+        executor.fetch_account_snapshot) is given, its position is used instead
+        of issuing another position request.
         """
         state = self.load()
         local_position = state.get("open_position")
 
-        exchange_position = executor.get_open_position(symbol)
+        if snapshot is not None:
+            exchange_position = snapshot.get("position")
+        else:
+            exchange_position = executor.get_open_position(symbol)
         mismatch = self._positions_mismatch(local_position, exchange_position)
         reason = "positions_match"
 
@@ -152,3 +267,61 @@ class StateStore:
             state=state,
             reason=reason,
         )
+
+
+class BatchedStateStore(StateStore):
+    """
+    StateStore whose save() coalesces bursts of saves into one write.
+
+    save() updates the in-memory mirror and schedules a flush debounce_ms later;
+    saves landing inside that window ride the same write. Call close() (or
+    flush()) before exit so pending changes reach disk.
+    """
+
+    def __init__(
+        self,
+        state_path: str,
+        logger: Optional[logging.Logger] = None,
+        debounce_ms: float = 10.0,
+    ):
+        super().__init__(state_path, logger)
+        self.debounce_seconds = max(0.0, float(debounce_ms)) / 1000.0
+        # Guards the mirror against the flush timer thread; re-entrant for save -> load.
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    def save(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage state in memory and schedule a single write for the burst."""
+        with self._lock:
+            if (
+                not self._dirty
+                and self._unchanged(state)
+                and time.monotonic() - self._last_write_monotonic < self.UPDATED_AT_REFRESH_SECONDS
+            ):
+                return self.load()
+            self._cached_state = copy.deepcopy(state)
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return copy.deepcopy(self._cached_state)
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            return super().flush()
+
+    def close(self) -> None:
+        """Write any staged state now and stop the pending timer."""
+        self.flush()
+
+    def load(self) -> Dict[str, Any]:
+        with self._lock:
+            return super().load()
+
+    def _set_fields(self, **fields: Any) -> Dict[str, Any]:
+        with self._lock:
+            return super()._set_fields(**fields)
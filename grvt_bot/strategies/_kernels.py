@@ -0,0 +1,79 @@
+"""
+Compiled indicator kernels.
+
+numba is optional: without it `njit` is a no-op decorator and the kernels run
+as plain Python loops with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def wilder_atr(high, low, close, n):
+    """
+    Average True Range with Wilder smoothing.
+
+    The first value (index n - 1) is the SMA of the first n true ranges; earlier
+    entries are NaN. The first true range is high - low.
+    """
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    if size < n or n < 1:
+        return out
+
+    total = high[0] - low[0]
+    for i in range(1, n):
+        total += max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    atr = total / n
+    out[n - 1] = atr
+
+    for i in range(n, size):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        atr += (tr - atr) / n
+        out[i] = atr
+    return out
+
+
+@njit(cache=True)
+def rolling_mean_std(values, window):
+    """
+    Full-window rolling mean and population std (ddof=0).
+
+    Returns two arrays of length len(values) - window + 1, aligned so index 0
+    covers values[0:window]. Each window is summed in two passes, matching
+    numpy's mean/std rather than a drifting running sum.
+    """
+    count = values.shape[0] - window + 1
+    if count < 1 or window < 1:
+        return np.empty(0), np.empty(0)
+
+    mean = np.empty(count)
+    std = np.empty(count)
+    for i in range(count):
+        total = 0.0
+        for j in range(i, i + window):
+            total += values[j]
+        mu = total / window
+        acc = 0.0
+        for j in range(i, i + window):
+            diff = values[j] - mu
+            acc += diff * diff
+        mean[i] = mu
+        std[i] = np.sqrt(acc / window)
+    return mean, std
@@ -57,7 +57,7 @@ class BaseStrategy(ABC):
         Args:
             order: Order details from exchange
         """
-        self.logger.info(f"[{self.name}] Order placed: {order.get('id', 'N/A')}")
+        self.logger.info("[%s] Order placed: %s", self.name, order.get('id', 'N/A'))
     
     def on_order_filled(self, order: Dict[str, Any]) -> None:
         """
@@ -66,7 +66,7 @@ class BaseStrategy(ABC):
         Args:
             order: Filled order details
         """
-        self.logger.info(f"[{self.name}] Order filled: {order.get('id', 'N/A')}")
+        self.logger.info("[%s] Order filled: %s", self.name, order.get('id', 'N/A'))
     
     def on_error(self, error: Exception) -> None:
         """
@@ -75,21 +75,21 @@ class BaseStrategy(ABC):
         Args:
             error: The exception that occurred
         """
-        self.logger.error(f"[{self.name}] Strategy error: {error}")
+        self.logger.error("[%s] Strategy error: %s", self.name, error)
     
     def initialize(self) -> None:
         """
         Initialize strategy (load data, setup indicators, etc.).
         Called once before the main loop starts.
         """
-        self.logger.info(f"[{self.name}] Strategy initialized")
+        self.logger.info("[%s] Strategy initialized", self.name)
     
     def cleanup(self) -> None:
         """
         Cleanup resources before strategy stops.
         Called once when bot is shutting down.
         """
-        self.logger.info(f"[{self.name}] Strategy cleanup")
+        self.logger.info("[%s] Strategy cleanup", self.name)
     
     def __repr__(self) -> str:
         return f"{self.name}()"
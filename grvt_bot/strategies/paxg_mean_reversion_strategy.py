@@ -5,17 +5,46 @@ Uses Bollinger Bands for entries and middle-band reversion for exits.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import math
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import pandas as pd
-import ta
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional backtest accelerator
+    pl = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from grvt_bot.strategies._kernels import NUMBA_AVAILABLE, rolling_mean_std, wilder_atr
 from grvt_bot.strategies.base import BaseStrategy
 
 
 class PAXGMeanReversionStrategy(BaseStrategy):
     """Mean reversion strategy for PAXG perpetuals."""
 
+    _REQUIRED_COLS = frozenset(("open", "high", "low", "close"))
+    # Batches at least this long compute bands with Polars when it is installed
+    POLARS_MIN_ROWS = 5000
+    # Position side aliases; common casings listed so the lookup usually skips lower()
+    _SIDE_MAP = {
+        "buy": "buy",
+        "long": "buy",
+        "BUY": "buy",
+        "LONG": "buy",
+        "Buy": "buy",
+        "Long": "buy",
+        "sell": "sell",
+        "short": "sell",
+        "SELL": "sell",
+        "SHORT": "sell",
+        "Sell": "sell",
+        "Short": "sell",
+    }
+
     def __init__(self, config: Any, logger: Optional[logging.Logger] = None):
         super().__init__(config, logger)
 
@@ -36,9 +65,26 @@ class PAXGMeanReversionStrategy(BaseStrategy):
         self.risk_amount = self.capital * (self.risk_per_trade_pct / 100.0)
 
         # Strategy state
-        self.price_data: pd.DataFrame = pd.DataFrame()
         self.current_position: Optional[Dict[str, Any]] = None
 
+        # Ring buffers holding only the rows the indicators and signals need:
+        # OHLC per row, and bb_high / bb_low / bb_mid / atr per row.
+        self._warmup_rows = max(self.bb_window, self.atr_window)
+        self._min_rows = self._warmup_rows + 1
+        self._capacity = self._warmup_rows + 2
+        self._ohlc = np.empty((self._capacity, 4), dtype=np.float64)
+        self._ind = np.full((self._capacity, 4), np.nan, dtype=np.float64)
+        self._head = 0
+        # Timestamp of the newest buffered candle, when the caller's frames carry one
+        self._last_timestamp: Any = None
+
+        # Running sum / sum of squares of the last bb_window closes
+        self._sum_c = 0.0
+        self._sum_c2 = 0.0
+        self.last_indicators: Dict[str, float] = {}
+        # Latest middle band as a plain float (NaN until warmed up) for check_exit
+        self._last_bb_mid = math.nan
+
         self.logger.info(
             "Initialized %s for %s on %s (risk per trade: $%.2f)",
             self.__class__.__name__,
@@ -60,55 +106,175 @@ class PAXGMeanReversionStrategy(BaseStrategy):
 
         return {}
 
-    def update_market_data(self, data: pd.DataFrame) -> None:
+    def update_market_data(self, data: "pd.DataFrame") -> None:
         """
         Update market data for indicator calculation.
 
         Expected columns: timestamp, open, high, low, close, volume
+
+        Accepts a pandas or Polars DataFrame. A multi-row frame is treated as a
+        fresh candle batch; a single row after the buffer is populated is
+        appended as the next candle, or replaces the newest candle when its
+        timestamp matches (a re-sent or still-forming bar).
         """
-        if data is None or data.empty:
+        if data is None or len(data) == 0:
             return
 
-        required_cols = {"open", "high", "low", "close"}
-        if not required_cols.issubset(data.columns):
-            self.logger.warning("Market data missing required columns: %s", required_cols)
+        if not self._REQUIRED_COLS.issubset(data.columns):
+            self.logger.warning(
+                "Market data missing required columns: %s", sorted(self._REQUIRED_COLS)
+            )
             return
 
-        self.price_data = data.copy()
-        self._calculate_indicators()
-
-    def _calculate_indicators(self) -> None:
-        if self.price_data.empty:
+        open_ = np.asarray(data["open"], dtype=np.float64)
+        high = np.asarray(data["high"], dtype=np.float64)
+        low = np.asarray(data["low"], dtype=np.float64)
+        close = np.asarray(data["close"], dtype=np.float64)
+
+        timestamp = self._last_row_timestamp(data)
+        if len(close) == 1 and self._head:
+            last_timestamp = self._last_timestamp
+            if timestamp is not None and last_timestamp is not None and timestamp == last_timestamp:
+                self._drop_last_candle()
+            self.append_candle(open_[0], high[0], low[0], close[0])
+            self._last_timestamp = timestamp
             return
 
-        if len(self.price_data) < max(self.bb_window, self.atr_window):
+        indicators = self._calculate_indicators(high, low, close)
+
+        rows = min(len(close), self._capacity)
+        np.copyto(self._ohlc[:rows, 0], open_[-rows:])
+        np.copyto(self._ohlc[:rows, 1], high[-rows:])
+        np.copyto(self._ohlc[:rows, 2], low[-rows:])
+        np.copyto(self._ohlc[:rows, 3], close[-rows:])
+        np.copyto(self._ind[:rows], indicators[-rows:])
+        self._head = rows
+        self._last_timestamp = timestamp
+        self._update_last_indicators()
+
+    @staticmethod
+    def _last_row_timestamp(data: "pd.DataFrame") -> Any:
+        if "timestamp" not in data.columns:
+            return None
+        return np.asarray(data["timestamp"][-1:])[0]
+
+    def _drop_last_candle(self) -> None:
+        """Undo the newest append so the next one replaces it instead of advancing."""
+        head = self._head - 1
+        self._head = head
+        if head >= self._warmup_rows:
+            window = self.bb_window
+            dropped = float(self._ohlc[(head - window) % self._capacity, 3])
+            close = float(self._ohlc[head % self._capacity, 3])
+            self._sum_c -= close - dropped
+            self._sum_c2 -= close * close - dropped * dropped
+
+    def append_candle(self, open_: float, high: float, low: float, close: float) -> None:
+        """
+        Append one closed candle and update indicators incrementally.
+
+        Bollinger Bands roll the running sums forward by one close and ATR takes
+        one Wilder step, so a live tick costs O(1) instead of a full recompute.
+        """
+        open_, high, low, close = float(open_), float(high), float(low), float(close)
+        # Direct calls carry no timestamp; update_market_data restores it afterwards.
+        self._last_timestamp = None
+        capacity = self._capacity
+        head = self._head
+        slot = head % capacity
+        self._ohlc[slot] = (open_, high, low, close)
+        self._head = head + 1
+
+        if head < self._warmup_rows:
+            # Still warming up: the whole history fits in slots [0, head].
+            rows = head + 1
+            self._ind[:rows] = self._calculate_indicators(
+                self._ohlc[:rows, 1], self._ohlc[:rows, 2], self._ohlc[:rows, 3]
+            )
+            self._update_last_indicators()
             return
 
-        indicator_bb = ta.volatility.BollingerBands(
-            close=self.price_data["close"],
-            window=self.bb_window,
-            window_dev=self.bb_std,
+        window = self.bb_window
+        dropped = float(self._ohlc[(head - window) % capacity, 3])
+        self._sum_c += close - dropped
+        self._sum_c2 += close * close - dropped * dropped
+        mean = self._sum_c / window
+        std = math.sqrt(max(self._sum_c2 / window - mean * mean, 0.0))
+
+        prev = (head - 1) % capacity
+        prev_close = float(self._ohlc[prev, 3])
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        n = self.atr_window
+        atr = (float(self._ind[prev, 3]) * (n - 1) + tr) / n
+
+        self._ind[slot] = (mean + self.bb_std * std, mean - self.bb_std * std, mean, atr)
+        self._update_last_indicators()
+
+    def _calculate_indicators(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> np.ndarray:
+        """Return a (len(close), 4) block of bb_high, bb_low, bb_mid, atr rows."""
+        size = len(close)
+        out = np.full((size, 4), np.nan)
+
+        if size < self._warmup_rows:
+            return out
+
+        # Bollinger Bands (population std, same as ta): compiled kernel when numba is
+        # available, else Polars for long series or strided NumPy windows
+        window = self.bb_window
+        if NUMBA_AVAILABLE:
+            mean, std = rolling_mean_std(close, window)
+        elif pl is not None and size >= self.POLARS_MIN_ROWS:
+            mean, std = self._rolling_mean_std_polars(close, window)
+        else:
+            windows = sliding_window_view(close, window)
+            mean = windows.mean(axis=1)
+            std = windows.std(axis=1, ddof=0)
+        band = self.bb_std * std
+
+        out[window - 1 :, 0] = mean + band
+        out[window - 1 :, 1] = mean - band
+        out[window - 1 :, 2] = mean
+
+        # Seed the running sums used by append_candle from the last window
+        tail = close[-window:]
+        self._sum_c = float(tail.sum())
+        self._sum_c2 = float(np.dot(tail, tail))
+
+        # ATR: Wilder smoothing seeded with the SMA of the first atr_window true ranges
+        out[:, 3] = wilder_atr(high, low, close, self.atr_window)
+
+        return out
+
+    @staticmethod
+    def _rolling_mean_std_polars(close: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Full-window rolling mean and population std via Polars, aligned to window - 1 onward."""
+        frame = pl.DataFrame({"close": close}).select(
+            pl.col("close").rolling_mean(window).alias("mean"),
+            pl.col("close").rolling_std(window, ddof=0).alias("std"),
         )
-        self.price_data["bb_high"] = indicator_bb.bollinger_hband()
-        self.price_data["bb_low"] = indicator_bb.bollinger_lband()
-        self.price_data["bb_mid"] = indicator_bb.bollinger_mavg()
-
-        indicator_atr = ta.volatility.AverageTrueRange(
-            high=self.price_data["high"],
-            low=self.price_data["low"],
-            close=self.price_data["close"],
-            window=self.atr_window,
+        return (
+            frame["mean"].to_numpy()[window - 1 :],
+            frame["std"].to_numpy()[window - 1 :],
         )
-        self.price_data["atr"] = indicator_atr.average_true_range()
 
-    @staticmethod
-    def _normalize_side(raw_side: Any) -> Optional[str]:
-        side = str(raw_side).lower()
-        if side in {"buy", "long"}:
-            return "buy"
-        if side in {"sell", "short"}:
-            return "sell"
-        return None
+    def _update_last_indicators(self) -> None:
+        bb_high, bb_low, bb_mid, atr = self._ind[(self._head - 1) % self._capacity].tolist()
+        self._last_bb_mid = bb_mid
+        if math.isnan(bb_mid) or math.isnan(atr):
+            self.last_indicators = {}
+            return
+        self.last_indicators = {"bb_high": bb_high, "bb_low": bb_low, "bb_mid": bb_mid, "atr": atr}
+
+    @classmethod
+    def _normalize_side(cls, raw_side: Any) -> Optional[str]:
+        side_map = cls._SIDE_MAP
+        if isinstance(raw_side, str):
+            side = side_map.get(raw_side)
+            if side is not None:
+                return side
+        return side_map.get(str(raw_side).lower())
 
     def get_signal(self) -> Optional[Dict[str, Any]]:
         """
@@ -116,56 +282,56 @@ class PAXGMeanReversionStrategy(BaseStrategy):
 
         Entry is based on previous candle close crossing Bollinger Bands.
         """
-        min_rows = max(self.bb_window, self.atr_window) + 1
-        if len(self.price_data) < min_rows:
+        head = self._head
+        if head < self._min_rows:
             return None
 
-        current_candle = self.price_data.iloc[-1]
-        previous_candle = self.price_data.iloc[-2]
-
         if self.current_position:
             return None
 
-        for key in ("bb_low", "bb_high", "bb_mid", "atr"):
-            value = current_candle.get(key) if key in current_candle else None
-            if value is None or pd.isna(value):
-                return None
-
-        atr = float(current_candle["atr"])
+        capacity = self._capacity
+        sl_atr_multiplier = self.sl_atr_multiplier
+        risk_amount = self.risk_amount
+        current = (head - 1) % capacity
+        previous = (head - 2) % capacity
+        _, _, middle_band, atr = self._ind[current].tolist()
+        if math.isnan(middle_band) or math.isnan(atr):
+            return None
         if atr <= 0:
             return None
 
-        entry_price = float(current_candle["open"])
-        sl_distance = atr * self.sl_atr_multiplier
+        entry_price = self._ohlc[current, 0].item()
+        sl_distance = atr * sl_atr_multiplier
         if sl_distance <= 0:
             return None
 
-        position_size_units = self.risk_amount / sl_distance
-        position_size_usdt = float(position_size_units * entry_price)
+        position_size_units = risk_amount / sl_distance
+        position_size_usdt = position_size_units * entry_price
         if position_size_usdt <= 0:
             return None
 
-        middle_band = float(current_candle["bb_mid"])
+        previous_close = self._ohlc[previous, 3].item()
+        previous_bb_high, previous_bb_low, _, _ = self._ind[previous].tolist()
 
-        if float(previous_candle["close"]) < float(previous_candle["bb_low"]):
+        if previous_close < previous_bb_low:
             stop_loss = entry_price - sl_distance
             return {
                 "side": "buy",
                 "amount_usdt": position_size_usdt,
                 "confidence": 1.0,
-                "reason": f"Close < Lower BB ({float(previous_candle['bb_low']):.2f})",
+                "reason": f"Close < Lower BB ({previous_bb_low:.2f})",
                 "sl_price": stop_loss,
                 "tp_price": middle_band,
                 "tp_condition": "middle_band",
             }
 
-        if float(previous_candle["close"]) > float(previous_candle["bb_high"]):
+        if previous_close > previous_bb_high:
             stop_loss = entry_price + sl_distance
             return {
                 "side": "sell",
                 "amount_usdt": position_size_usdt,
                 "confidence": 1.0,
-                "reason": f"Close > Upper BB ({float(previous_candle['bb_high']):.2f})",
+                "reason": f"Close > Upper BB ({previous_bb_high:.2f})",
                 "sl_price": stop_loss,
                 "tp_price": middle_band,
                 "tp_condition": "middle_band",
@@ -175,19 +341,18 @@ class PAXGMeanReversionStrategy(BaseStrategy):
 
     def check_exit(self, current_price: float, position: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check dynamic exit conditions for an open position."""
-        if not position or self.price_data.empty:
+        if not position:
             return None
 
         side = self._normalize_side(position.get("side"))
         if side is None:
             return None
 
-        middle_band = self.price_data.iloc[-1].get("bb_mid")
-        if middle_band is None or pd.isna(middle_band):
+        middle_band = self._last_bb_mid
+        if math.isnan(middle_band):
             return None
 
         self.current_position = position
-        middle_band = float(middle_band)
 
         if side == "buy" and current_price >= middle_band:
             return {
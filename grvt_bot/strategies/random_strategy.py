@@ -12,6 +12,11 @@ from typing import Optional, Dict, Any
 from grvt_bot.strategies.base import BaseStrategy
 
 
+# Out of 256 equally likely draws: ~30% buy, ~40% no signal, ~30% sell
+_BUY_SLOTS = 77
+_SELL_SLOTS = 77
+
+
 class RandomStrategy(BaseStrategy):
     """
     Random signal generator for demonstration.
@@ -29,18 +34,43 @@ class RandomStrategy(BaseStrategy):
             logger: Logger instance
         """
         super().__init__(config, logger)
-        self.last_signal_time = 0
+        # Monotonic clock reading; -inf lets the first call through regardless of uptime
+        self.last_signal_time = float("-inf")
         
-        # Get signal interval from config or use default
-        if config and hasattr(config, 'MAIN_LOOP_INTERVAL'):
-            self.signal_interval = int(config.MAIN_LOOP_INTERVAL) * 60
-        elif config and hasattr(config, 'get'):
-            self.signal_interval = int(config.get('trading', 'loop_interval', 1)) * 60
-        else:
-            self.signal_interval = 60
+        # Resolve config once; get_signal only reads these attributes
+        self.signal_interval = int(
+            self._resolve_config(config, 'MAIN_LOOP_INTERVAL', 'trading', 'loop_interval', 1)
+        ) * 60
+        order_size = self._resolve_config(
+            config, 'ORDER_SIZE_USDT', 'trading', 'order_size_usdt', 500
+        )
+        self.order_size = order_size
+
+        buy = {
+            'side': 'buy',
+            'amount_usdt': order_size,
+            'confidence': 0.5,
+            'reason': 'Random signal',
+        }
+        sell = dict(buy, side='sell')
+        no_signal_slots = 256 - _BUY_SLOTS - _SELL_SLOTS
+        self._choices = [buy] * _BUY_SLOTS + [None] * no_signal_slots + [sell] * _SELL_SLOTS
         
-        self.logger.info(f"RandomStrategy initialized with {self.signal_interval}s interval")
+        self.logger.info("RandomStrategy initialized with %ss interval", self.signal_interval)
     
+    @staticmethod
+    def _resolve_config(config: Any, attr: str, section: str, key: str, default: Any) -> Any:
+        """Read a value from a config attribute, then config.get(section, key), then default."""
+        if not config:
+            return default
+        value = getattr(config, attr, None)
+        if value is not None:
+            return value
+        getter = getattr(config, 'get', None)
+        if getter is not None:
+            return getter(section, key, default)
+        return default
+
     def get_signal(self) -> Optional[Dict[str, Any]]:
         """
         Generate a random trading signal.
@@ -48,7 +78,7 @@ class RandomStrategy(BaseStrategy):
         Returns:
             None if no signal, or dict with 'side' and 'amount_usdt'
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Throttling: don't generate signals too frequently
         if current_time - self.last_signal_time < self.signal_interval:
@@ -58,41 +88,16 @@ class RandomStrategy(BaseStrategy):
         # In a real bot, this would check indicators, price action, etc.
         self.last_signal_time = current_time
         
-        chance = random.random()
-        
-        # Get order size from config
-        if self.config:
-            if hasattr(self.config, 'ORDER_SIZE_USDT'):
-                order_size = self.config.ORDER_SIZE_USDT
-            elif hasattr(self.config, 'get'):
-                order_size = self.config.get('trading', 'order_size_usdt', 500)
-            else:
-                order_size = 500
-        else:
-            order_size = 500
-        
-        # 30% chance to buy
-        if chance < 0.3:
-            self.logger.info(f"[RandomStrategy] Generated BUY signal (chance: {chance:.2f})")
-            return {
-                'side': 'buy',
-                'amount_usdt': order_size,
-                'confidence': 0.5,
-                'reason': f'Random signal (chance: {chance:.2f})'
-            }
-        
-        # 30% chance to sell
-        elif chance > 0.7:
-            self.logger.info(f"[RandomStrategy] Generated SELL signal (chance: {chance:.2f})")
-            return {
-                'side': 'sell',
-                'amount_usdt': order_size,
-                'confidence': 0.5,
-                'reason': f'Random signal (chance: {chance:.2f})'
-            }
-        
-        # 40% chance: no signal
-        return None
+        draw = random.getrandbits(8)
+        template = self._choices[draw]
+        if template is None:
+            return None
+
+        self.logger.info(
+            "[RandomStrategy] Generated %s signal (draw: %d/255)", template['side'].upper(), draw
+        )
+        # Copy so callers can't mutate the shared template
+        return dict(template)
     
     def initialize(self) -> None:
         """Initialize the random strategy."""
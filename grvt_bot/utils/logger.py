@@ -5,7 +5,19 @@ Logging utilities for GRVT Bot.
 import logging
 import sys
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+_FILE_FMT = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_CON_FMT = logging.Formatter(
+    '%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+# Loggers already configured by setup_logger, keyed by name -> (settings, logger)
+_CONFIGURED: Dict[str, Tuple[tuple, logging.Logger]] = {}
 
 
 def setup_logger(
@@ -31,23 +43,23 @@ def setup_logger(
     
     Returns:
         Configured logger instance
+
+    Repeated calls with the same arguments return the already configured
+    logger without reopening the log file.
     """
+    settings = (log_file, level, console, max_bytes, backup_count, quiet_third_party)
+    cached = _CONFIGURED.get(name)
+    if cached is not None and cached[0] == settings:
+        return cached[1]
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
     logger.propagate = False
     
     # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
-    
-    # Format
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
     
     # File handler
     if log_file:
@@ -58,14 +70,14 @@ def setup_logger(
             encoding='utf-8',
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(_FILE_FMT)
         logger.addHandler(file_handler)
     
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CON_FMT)
         logger.addHandler(console_handler)
 
     if quiet_third_party:
@@ -79,4 +91,5 @@ def setup_logger(
         for noisy_name in ("urllib3", "requests", "pysdk", "asyncio"):
             logging.getLogger(noisy_name).setLevel(logging.WARNING)
 
+    _CONFIGURED[name] = (settings, logger)
     return logger
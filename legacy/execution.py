@@ -1,27 +1,14 @@
 import logging
-import time
-import random
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, Dict, Any
-from eth_account import Account
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict
 
 # Import local pysdk
 from pysdk.grvt_ccxt import GrvtCcxt
 from pysdk.grvt_ccxt_env import GrvtEnv
-from pysdk.grvt_raw_types import (
-    Kind, 
-    Order, 
-    OrderLeg, 
-    TimeInForce, 
-    OrderMetadata, 
-    Signature, 
-    TriggerBy
-)
 
 import config
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Handlers are configured by the entry-point script (main.py); this module only logs.
 logger = logging.getLogger(__name__)
 
 class GRVTExecutor:
@@ -45,9 +32,9 @@ class GRVTExecutor:
             }
             # Initialize the CCXT-compatible client
             self.client = GrvtCcxt(env, logger, parameters=params)
-            logger.info(f"Initialized GRVT client for env: {self.env_str}")
+            logger.info("Initialized GRVT client for env: %s", self.env_str)
         except Exception as e:
-            logger.error(f"Failed to initialize GRVT client: {e}")
+            logger.error("Failed to initialize GRVT client: %s", e)
             raise
 
     def get_account_summary(self):
@@ -58,7 +45,7 @@ class GRVTExecutor:
             balance = self.client.fetch_balance() 
             return balance
         except Exception as e:
-            logger.error(f"Error fetching account summary: {e}")
+            logger.error("Error fetching account summary: %s", e)
             return None
 
     def get_market_price(self, symbol: str) -> float:
@@ -72,26 +59,26 @@ class GRVTExecutor:
             elif 'result' in ticker and 'last_price' in ticker['result']:
                  return float(ticker['result']['last_price'])
             
-            logger.error(f"Unknown ticker structure: {ticker}")
+            logger.error("Unknown ticker structure: %s", ticker)
             return 0.0
         except Exception as e:
-            logger.error(f"Error fetching ticker for {symbol}: {e}")
+            logger.error("Error fetching ticker for %s: %s", symbol, e)
             return 0.0
 
     def set_leverage(self, symbol: str, leverage: int):
         """Set leverage for a symbol. Calls set_leverage if supported by client."""
         try:
-            logger.info(f"Attempting to set leverage {leverage}x for {symbol}")
+            logger.info("Attempting to set leverage %sx for %s", leverage, symbol)
             # Try using the client's set_leverage method
             if hasattr(self.client, 'set_leverage') and callable(self.client.set_leverage):
                 result = self.client.set_leverage(leverage, symbol)
-                logger.info(f"Set leverage response: {result}")
+                logger.info("Set leverage response: %s", result)
                 return result
             else:
                 logger.warning("set_leverage not available in client")
                 return None
         except Exception as e:
-            logger.error(f"Error setting leverage: {e}")
+            logger.error("Error setting leverage: %s", e)
             import traceback
             logger.error(traceback.format_exc())
             return None
@@ -119,7 +106,7 @@ class GRVTExecutor:
             )
             return self._handle_order_response(order, 'market')
         except Exception as e:
-            logger.error(f"Error placing market order: {e}")
+            logger.error("Error placing market order: %s", e)
             return None
 
     def place_limit_order(self, symbol: str, side: str, amount: float, price: float, leverage: int = None, params: Dict = None):
@@ -144,7 +131,7 @@ class GRVTExecutor:
             )
             return self._handle_order_response(order, 'limit')
         except Exception as e:
-            logger.error(f"Error placing limit order: {e}")
+            logger.error("Error placing limit order: %s", e)
             return None
 
     def _handle_order_response(self, order_response: Dict, order_type: str) -> Optional[Dict]:
@@ -157,7 +144,7 @@ class GRVTExecutor:
              # Some APIs use 0 for success, others don't return code on success.
              # Based on logs, error has 'code' and 'status': 400
              if order_response.get('status') != 200 and 'message' in order_response:
-                 logger.error(f"Order failed: {order_response}")
+                 logger.error("Order failed: %s", order_response)
                  return None
 
         # Normalize result
@@ -173,27 +160,40 @@ class GRVTExecutor:
 
         # Double check if we successfully got an ID
         if 'id' in order_response:
-             logger.info(f"{order_type.capitalize()} Order placed: {order_response['id']}")
+             logger.info("%s Order placed: %s", order_type.capitalize(), order_response['id'])
              return order_response
         
-        logger.warning(f"Order placed but ID not found in response: {order_response}")
+        logger.warning("Order placed but ID not found in response: %s", order_response)
         return order_response
 
     def close_all_positions(self, symbol: str):
-        """Closes all matching positions for the symbol."""
+        """Closes all matching positions for the symbol.
+
+        GRVT has no batch-close endpoint (cancel_all_orders only cancels resting
+        orders), so the per-position market closes are sent concurrently.
+        """
         try:
             positions = self.client.fetch_positions([symbol])
+            closes = []
             for position in positions:
                 contracts = position['contracts']
                 if contracts != 0:
                     side = 'sell' if contracts > 0 else 'buy'
-                    amount = abs(contracts)
-                    logger.info(f"Closing position: {contracts} contracts of {symbol}")
-                    self.place_market_order(symbol, side, amount)
+                    logger.info("Closing position: %s contracts of %s", contracts, symbol)
+                    closes.append((side, abs(contracts)))
+
+            if len(closes) == 1:
+                side, amount = closes[0]
+                self.place_market_order(symbol, side, amount)
+            elif closes:
+                with ThreadPoolExecutor(max_workers=len(closes)) as pool:
+                    for side, amount in closes:
+                        pool.submit(self.place_market_order, symbol, side, amount)
         except Exception as e:
-            logger.error(f"Error closing positions: {e}")
+            logger.error("Error closing positions: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     # Simple test
     try:
         executor = GRVTExecutor()
@@ -24,8 +24,8 @@ logger = logging.getLogger("main")
 
 def main():
     logger.info("Starting GRVT Demo Bot...")
-    logger.info(f"Environment: {config.GRVT_ENV}")
-    logger.info(f"Trading Symbol: {config.SYMBOL}")
+    logger.info("Environment: %s", config.GRVT_ENV)
+    logger.info("Trading Symbol: %s", config.SYMBOL)
 
     try:
         # Initialize Executor
@@ -35,7 +35,7 @@ def main():
         strategy = TradingLogic()
         
         logger.info("Bot initialized successfully. Starting main loop.")
-        logger.info(f"IMPORTANT: Set leverage to {config.LEVERAGE}x on GRVT web interface manually.")
+        logger.info("IMPORTANT: Set leverage to %sx on GRVT web interface manually.", config.LEVERAGE)
         
         while True:
             try:
@@ -43,7 +43,7 @@ def main():
                 signal = strategy.get_signal()
                 
                 if signal:
-                    logger.info(f"Signal received: {signal}")
+                    logger.info("Signal received: %s", signal)
                     
                     side = signal['side']
                     amount_usdt = signal.get('amount_usdt', config.ORDER_SIZE_USDT)
@@ -56,7 +56,7 @@ def main():
                         # Round to 3 decimal places for larger order size
                         amount_base = round(amount_base, 3)
                         
-                        logger.info(f"Executing {side} order for {amount_base:.3f} {config.SYMBOL} (~{amount_usdt} USDT)")
+                        logger.info("Executing %s order for %.3f %s (~%s USDT)", side, amount_base, config.SYMBOL, amount_usdt)
                         
                         # 2. Execute Order
                         executor.place_market_order(
@@ -72,14 +72,14 @@ def main():
                 time.sleep(config.MAIN_LOOP_INTERVAL)
                 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error("Error in main loop: %s", e)
                 logger.error(traceback.format_exc())
                 time.sleep(5) # Wait a bit before retrying after error
                 
     except KeyboardInterrupt:
         logger.info("Bot stopped by user.")
     except Exception as e:
-        logger.critical(f"Fatal error: {e}")
+        logger.critical("Fatal error: %s", e)
         logger.critical(traceback.format_exc())
 
 if __name__ == "__main__":
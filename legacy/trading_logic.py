@@ -1,32 +1,41 @@
 import random
 import time
+from collections import deque
 from typing import Optional, Dict
 import config
 
 class TradingLogic:
     def __init__(self):
-        self.last_signal_time = 0
         self.signal_interval = 60 # Seconds between signals
+        # Monotonic deadline for the next signal, in integer nanoseconds
+        self._interval_ns = self.signal_interval * 1_000_000_000
+        self._next_signal_ns = 0
+
+        # Signals are read-only to callers, so the same dicts are handed out each time
+        self._buy = {'side': 'buy', 'amount_usdt': config.ORDER_SIZE_USDT}
+        self._sell = {'side': 'sell', 'amount_usdt': config.ORDER_SIZE_USDT}
+        self._choices = (self._buy, None, self._sell)
+        self._cum_weights = (0.3, 0.7, 1.0)  # 30% buy / 40% none / 30% sell
+
+        # Recent (monotonic_ns, signal) pairs; bounded so long runs don't grow memory
+        self._history = deque(maxlen=256)
 
     def get_signal(self) -> Optional[Dict]:
         """
         Generates a trading signal.
         Returns None if no signal, or a dict: {'side': 'buy'/'sell', 'amount_usdt': float}
         """
-        current_time = time.time()
-        
+        now = time.monotonic_ns()
+
         # Simple throttling
-        if current_time - self.last_signal_time < self.signal_interval:
+        if now < self._next_signal_ns:
             return None
 
         # Random signal generation for DEMO purposes
         # In a real bot, this would check indicators, price action, etc.
-        self.last_signal_time = current_time
-        
-        chance = random.random()
-        if chance < 0.3:
-            return {'side': 'buy', 'amount_usdt': config.ORDER_SIZE_USDT}
-        elif chance > 0.7:
-            return {'side': 'sell', 'amount_usdt': config.ORDER_SIZE_USDT}
+        self._next_signal_ns = now + self._interval_ns
         
-        return None
+        signal = random.choices(self._choices, cum_weights=self._cum_weights)[0]
+        if signal is not None:
+            self._history.append((now, signal))
+        return signal
@@ -11,9 +11,6 @@ import logging
 from pathlib import Path
 from typing import Any, Optional, Tuple
 
-from grvt_bot.core.config import ConfigManager
-from grvt_bot.core.executor import GRVTExecutor
-
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,38 +19,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Places a leverage value may live in a payload, checked in order.
+_LEV_PATHS = (("leverage",), ("info", "leverage"), ("result", "leverage"))
+
+
 def _extract_leverage_value(payload: Any) -> Tuple[Optional[Any], Optional[str]]:
     """
     Best-effort extraction of leverage value from various payload formats.
     """
-    if payload is None:
-        return None, None
-
     if isinstance(payload, list):
-        if not payload:
-            return None, None
-        payload = payload[0]
+        payload = payload[0] if payload else None
 
-    if isinstance(payload, dict):
-        symbol = payload.get("symbol") or payload.get("instrument")
+    if not isinstance(payload, dict):
+        return None, None
 
-        leverage = payload.get("leverage")
-        if leverage is not None:
-            return leverage, symbol
+    for path in _LEV_PATHS:
+        value: Any = payload
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            return value, payload.get("symbol") or payload.get("instrument")
 
-        info = payload.get("info")
-        if isinstance(info, dict):
-            leverage = info.get("leverage")
-            if leverage is not None:
-                return leverage, symbol
+    return None, None
 
-        result = payload.get("result")
-        if isinstance(result, dict):
-            leverage = result.get("leverage")
-            if leverage is not None:
-                return leverage, symbol
 
-    return None, None
+def _leverage_matches(actual: Any, expected: Any) -> bool:
+    """
+    Compare leverages numerically so "10.0" matches 10; falls back to string equality.
+    """
+    try:
+        return float(actual) == float(expected)
+    except (TypeError, ValueError):
+        return str(actual) == str(expected)
 
 
 def main() -> int:
@@ -63,11 +60,16 @@ def main() -> int:
     print()
 
     try:
-        config_path = Path(os.getenv("GRVT_CONFIG_PATH", "config/config.yaml")).resolve()
-        if not config_path.exists():
+        config_path = Path(os.getenv("GRVT_CONFIG_PATH", "config/config.yaml"))
+        if not config_path.is_file():
             print(f"Config file not found: {config_path}")
             print("Set GRVT_CONFIG_PATH or create config/config.yaml first.")
             return 1
+        config_path = config_path.resolve()
+
+        # Imported here so a missing config exits before the SDK import cost.
+        from grvt_bot.core.config import ConfigManager
+        from grvt_bot.core.executor import GRVTExecutor
 
         config = ConfigManager(config_path=str(config_path))
         config.validate()
@@ -86,8 +88,18 @@ def main() -> int:
         print(f"Expected from config: {config.LEVERAGE}x")
         print()
 
-        result = executor.get_current_leverage(config.SYMBOL)
-        leverage, symbol = _extract_leverage_value(result)
+        # One account-wide query serves both sections; the per-symbol call is only a fallback.
+        all_leverages = executor.get_current_leverage()
+        entries = all_leverages if isinstance(all_leverages, list) else []
+        parsed = [_extract_leverage_value(entry) for entry in entries]
+
+        leverage, symbol = next(
+            ((value, entry_symbol) for value, entry_symbol in parsed if entry_symbol == config.SYMBOL),
+            (None, None),
+        )
+        if leverage is None:
+            leverage, symbol = _extract_leverage_value(executor.get_current_leverage(config.SYMBOL))
+
         if leverage is not None:
             print("Current leverage settings:")
             print(f"  Symbol: {symbol or config.SYMBOL}")
@@ -95,7 +107,7 @@ def main() -> int:
             print()
 
             # Compare with config
-            if str(leverage) == str(config.LEVERAGE):
+            if _leverage_matches(leverage, config.LEVERAGE):
                 print("Leverage matches config.")
             else:
                 print("WARNING: Leverage mismatch.")
@@ -112,19 +124,18 @@ def main() -> int:
         print("Checking all leverage settings...")
         print()
 
-        # Check all leverages
-        all_leverages = executor.get_current_leverage()
-        if isinstance(all_leverages, list) and all_leverages:
-            print(f"Found {len(all_leverages)} leverage entries:")
+        if entries:
+            print(f"Found {len(entries)} leverage entries:")
             print()
-            for entry in all_leverages[:10]:
-                value, entry_symbol = _extract_leverage_value(entry)
-                if value is None:
-                    continue
-                print(f"  - {entry_symbol or 'unknown':20s} : {value}x")
-
-            if len(all_leverages) > 10:
-                print(f"  ... and {len(all_leverages) - 10} more")
+            lines = [
+                f"  - {entry_symbol or 'unknown':20s} : {value}x"
+                for value, entry_symbol in parsed[:10]
+                if value is not None
+            ]
+            if len(entries) > 10:
+                lines.append(f"  ... and {len(entries) - 10} more")
+            if lines:
+                print("\n".join(lines))
         elif all_leverages is not None:
             print(f"Leverage response type: {type(all_leverages).__name__}")
             print(all_leverages)
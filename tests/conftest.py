@@ -1,30 +1,59 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+from grvt_bot.core.config import ConfigManager
+from grvt_bot.core.executor import GRVTExecutor
+
 
 RUN_LIVE_TESTS_ENV = "RUN_LIVE_TESTS"
 LIVE_TEST_CONFIG_ENV = "GRVT_TEST_CONFIG"
 
 
+@lru_cache(maxsize=1)
 def _live_tests_enabled() -> bool:
     return os.getenv(RUN_LIVE_TESTS_ENV, "0").strip().lower() in {"1", "true", "yes"}
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help=f"run integration tests against the exchange (same as {RUN_LIVE_TESTS_ENV}=1)",
+    )
+
+
+def _live_requested(config) -> bool:
+    return bool(config.getoption("--live")) or _live_tests_enabled()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests up front unless live runs were requested."""
+    if _live_requested(config):
+        return
+    skip_live = pytest.mark.skip(
+        reason=f"live tests disabled; pass --live or set {RUN_LIVE_TESTS_ENV}=1"
+    )
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_live)
+
+
 @pytest.fixture(scope="session")
-def live_config():
+def live_config(request):
     """Load validated config for live integration tests."""
-    if not _live_tests_enabled():
+    if not _live_requested(request.config):
         pytest.skip(
-            f"Live tests disabled. Set {RUN_LIVE_TESTS_ENV}=1 to enable integration tests."
+            f"Live tests disabled. Pass --live or set {RUN_LIVE_TESTS_ENV}=1 to enable integration tests."
         )
 
-    config_path = Path(os.getenv(LIVE_TEST_CONFIG_ENV, "config/config.yaml")).resolve()
-    if not config_path.exists():
+    config_path = Path(os.getenv(LIVE_TEST_CONFIG_ENV, "config/config.yaml"))
+    if not config_path.is_file():
         pytest.skip(f"Live test config not found: {config_path}")
-
-    from grvt_bot.core.config import ConfigManager
+    config_path = config_path.resolve()
 
     config = ConfigManager(config_path=str(config_path))
     try:
@@ -38,7 +67,5 @@ def live_config():
 @pytest.fixture(scope="session")
 def live_executor(live_config):
     """Build executor for live integration tests."""
-    from grvt_bot.core.executor import GRVTExecutor
-
     return GRVTExecutor(live_config)
 
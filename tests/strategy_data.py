@@ -0,0 +1,44 @@
+"""Shared config and synthetic candles for strategy validation (tests and validate_strategy.py)."""
+
+import numpy as np
+import pandas as pd
+
+
+class MockConfig:
+    def __init__(self):
+        self.config = {
+            "strategy": {
+                "timeframe": "15m",
+                "symbol": "PAXG_USDT_Perp",
+                "bb_window": 20,
+                "bb_std": 2.0,
+                "atr_window": 14,
+                "sl_atr_multiplier": 1.5,
+                "capital": 100000.0,
+                "risk_per_trade_pct": 0.25,
+            },
+            "trading": {"order_size_usdt": 500},
+        }
+
+    def get(self, section, key, default=None):
+        return self.config.get(section, {}).get(key, default)
+
+
+def generate_data(n=100, seed=42):
+    """Deterministic synthetic 15m candles."""
+    # The Generator is local, so no global RNG state is touched.
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((n, 3))
+    close = (rng.standard_normal(n) * 10 + 2000).cumsum()
+    close += np.sin(np.linspace(0, 10, n)) * 20
+
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start="2024-01-01", periods=n, freq="15min"),
+            "open": close + noise[:, 0] * 2,
+            "high": close + np.abs(noise[:, 1]) * 5,
+            "low": close - np.abs(noise[:, 2]) * 5,
+            "close": close,
+            "volume": rng.integers(100, 1000, n),
+        }
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from grvt_bot.cli.main import (
+    normalize_side,
     resolve_startup_mismatch_policy,
     seconds_until_data_fetch,
     seconds_until_next_run,
@@ -68,3 +69,11 @@ def test_should_close_on_opposite_signal_false_for_same_side():
 def test_should_close_on_opposite_signal_false_for_invalid_payload():
     assert should_close_on_opposite_signal(None, {"side": "sell"}) is False
     assert should_close_on_opposite_signal({"side": "buy"}, None) is False
+    assert should_close_on_opposite_signal({"side": "buy"}, {"side": "hold"}) is False
+
+
+def test_normalize_side_accepts_aliases_in_any_case():
+    assert normalize_side("SHORT") == "sell"
+    assert normalize_side("Long") == "buy"
+    assert normalize_side("sell") == "sell"
+    assert normalize_side(None) is None
@@ -1,3 +1,5 @@
+import pytest
+
 from grvt_bot.core.config import ConfigManager
 
 
@@ -58,3 +60,59 @@ def test_ops_runtime_guard_defaults_present():
     assert config.STARTUP_MISMATCH_POLICY == "adopt_continue"
     assert config.EXECUTION_CLOSE_MODE == "reduce_only_twap_slice"
     assert config.EXECUTION_LIQUIDITY_USAGE_PCT == 0.20
+
+
+def test_properties_memoized_and_invalidated_on_set():
+    config = ConfigManager()
+    assert config.SYMBOL == "BTC_USDT_Perp"
+    assert "SYMBOL" in vars(config)
+
+    config.set("trading", "symbol", "ETH_USDT_Perp")
+    assert config.SYMBOL == "ETH_USDT_Perp"
+
+    config.load_from_dict({"trading": {"symbol": "PAXG_USDT_Perp"}})
+    assert config.SYMBOL == "PAXG_USDT_Perp"
+
+
+def test_default_config_is_read_only():
+    with pytest.raises(TypeError):
+        ConfigManager.DEFAULT_CONFIG["trading"]["symbol"] = "ETH_USDT_Perp"
+
+    config = ConfigManager()
+    config.get("risk", "tracks")["normal"]["max_drawdown_pct"] = 1.0
+    assert ConfigManager().get("risk", "tracks")["normal"]["max_drawdown_pct"] == 5.0
+
+
+def test_set_coerces_typed_keys_and_rejects_bad_values():
+    config = ConfigManager(config_dict={})
+    config.set("trading", "leverage", "5")
+    config.set("execution", "close_retry_jitter", "no")
+    assert config.LEVERAGE == 5
+    assert config.EXECUTION_CLOSE_RETRY_JITTER is False
+
+    with pytest.raises(ValueError):
+        config.set("trading", "leverage", "ten")
+    assert config.LEVERAGE == 5
+
+
+def test_set_keeps_fractional_order_size_and_rejects_fractional_ints():
+    config = ConfigManager(config_dict={})
+    config.set("trading", "order_size_usdt", 10.5)
+    assert config.ORDER_SIZE_USDT == 10.5
+
+    config.load_from_dict({"trading": {"order_size_usdt": 12.5}})
+    assert config.ORDER_SIZE_USDT == 12.5
+
+    config.set("trading", "leverage", 10.0)
+    assert config.LEVERAGE == 10
+    with pytest.raises(ValueError):
+        config.set("trading", "leverage", 10.5)
+    assert config.LEVERAGE == 10
+
+
+def test_set_coercion_is_scoped_to_section():
+    config = ConfigManager(config_dict={})
+    config.set("strategy", "enabled", "maybe")
+    config.set("alerts", "enabled", "no")
+    assert config.get("strategy", "enabled") == "maybe"
+    assert config.get("alerts", "enabled") is False
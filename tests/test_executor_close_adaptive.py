@@ -1,4 +1,6 @@
-from grvt_bot.core.executor import GRVTExecutor
+import asyncio
+
+from grvt_bot.core.executor import CloseSettings, GRVTExecutor
 
 
 class DummyConfig:
@@ -15,6 +17,10 @@ class DummyConfig:
         return self.values.get(section, {}).get(key, default)
 
 
+async def no_sleep(_seconds):
+    return None
+
+
 def build_executor(monkeypatch, config_values=None):
     monkeypatch.setattr(GRVTExecutor, "initialize_client", lambda self: None)
     cfg = DummyConfig(config_values)
@@ -24,7 +30,7 @@ def build_executor(monkeypatch, config_values=None):
 
 def test_close_position_adaptive_single_shot_on_good_liquidity(monkeypatch):
     executor, cfg = build_executor(monkeypatch)
-    monkeypatch.setattr("grvt_bot.core.executor.time.sleep", lambda _: None)
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", no_sleep)
 
     positions = [
         {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
@@ -35,7 +41,11 @@ def test_close_position_adaptive_single_shot_on_good_liquidity(monkeypatch):
         "get_open_position",
         lambda _symbol: positions.pop(0) if positions else None,
     )
-    monkeypatch.setattr(executor, "get_reference_price", lambda _symbol, _side: 100.0)
+    monkeypatch.setattr(
+        executor,
+        "_fetch_ticker_payload",
+        lambda _symbol: {"best_ask_price": 100.0, "best_bid_price": 99.9},
+    )
     monkeypatch.setattr(
         executor,
         "get_order_book",
@@ -68,11 +78,11 @@ def test_close_position_adaptive_single_shot_on_good_liquidity(monkeypatch):
 
 def test_close_position_adaptive_slices_on_thin_liquidity(monkeypatch):
     executor, cfg = build_executor(monkeypatch)
-    monkeypatch.setattr("grvt_bot.core.executor.time.sleep", lambda _: None)
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", no_sleep)
 
     positions = [
         {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
-        {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 0.8},
+        # The post-slice poll is reused as the next iteration's position.
         {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 0.8},
         None,
     ]
@@ -81,7 +91,11 @@ def test_close_position_adaptive_slices_on_thin_liquidity(monkeypatch):
         "get_open_position",
         lambda _symbol: positions.pop(0) if positions else None,
     )
-    monkeypatch.setattr(executor, "get_reference_price", lambda _symbol, _side: 100.0)
+    monkeypatch.setattr(
+        executor,
+        "_fetch_ticker_payload",
+        lambda _symbol: {"best_ask_price": 100.0, "best_bid_price": 99.9},
+    )
 
     books = [
         {"asks": [(100.0, 0.3)], "bids": [(99.9, 0.3)]},
@@ -114,6 +128,79 @@ def test_close_position_adaptive_slices_on_thin_liquidity(monkeypatch):
     assert float(calls[0]["amount"]) < 1.0
     assert calls[0]["params"]["reduce_only"] is True
     assert calls[1]["params"]["reduce_only"] is True
+    assert calls[0]["client_order_id"] == "100"
+    assert calls[1]["client_order_id"] == "101"
+    # The seed is local to the close; the executor's own sequence is untouched.
+    assert int(executor.next_client_order_id()) > 101
+
+
+def test_close_position_adaptive_verifies_reported_full_fill(monkeypatch):
+    executor, cfg = build_executor(monkeypatch)
+    sleeps = []
+
+    async def record_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", record_sleep)
+
+    positions = [{"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0}, None]
+    polls = []
+
+    def get_open_position(_symbol):
+        polls.append(_symbol)
+        return positions.pop(0) if positions else None
+
+    monkeypatch.setattr(executor, "get_open_position", get_open_position)
+    monkeypatch.setattr(
+        executor,
+        "_fetch_ticker_payload",
+        lambda _symbol: {"best_ask_price": 100.0, "best_bid_price": 99.9},
+    )
+    monkeypatch.setattr(
+        executor,
+        "get_order_book",
+        lambda _symbol, limit=20: {"asks": [(100.0, 3.0)], "bids": [(99.9, 2.0)]},
+    )
+    monkeypatch.setattr(executor, "get_market_limits", lambda _symbol: {"min_qty": 0.01, "base_decimals": 3})
+    monkeypatch.setattr(
+        executor,
+        "place_market_order",
+        lambda **kwargs: {"id": "ord-1", "result": {"state": {"traded_size": ["1.0"]}}},
+    )
+
+    result = executor.close_position_adaptive(
+        symbol="PAXG_USDT_Perp",
+        side="buy",
+        remaining_qty=1.0,
+        config=cfg,
+    )
+    assert result["code"] == "CLOSE_SUCCESS"
+    assert result["orders_sent"] == 1
+    # One verification poll after the fill, without the settle wait.
+    assert len(polls) == 2
+    assert sleeps == []
+
+    # A stale fill report does not mark a live position as flat.
+    monkeypatch.setattr(
+        executor,
+        "get_open_position",
+        lambda _symbol: {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
+    )
+    result = executor.close_position_adaptive(
+        symbol="PAXG_USDT_Perp",
+        side="buy",
+        remaining_qty=1.0,
+        config=cfg,
+    )
+    assert result["success"] is False
+    assert result["remaining_qty"] == 1.0
+
+
+def test_next_client_order_id_is_strictly_increasing(monkeypatch):
+    executor, _cfg = build_executor(monkeypatch)
+    ids = [int(executor.next_client_order_id()) for _ in range(5)]
+    assert ids == sorted(set(ids))
+    assert all(0 < value <= 0x7FFFFFFF for value in ids)
 
 
 def test_close_position_adaptive_halts_on_no_progress(monkeypatch):
@@ -121,13 +208,13 @@ def test_close_position_adaptive_halts_on_no_progress(monkeypatch):
         monkeypatch,
         config_values={"execution": {"close_no_progress_retries": 3, "close_max_retries": 20}},
     )
-    monkeypatch.setattr("grvt_bot.core.executor.time.sleep", lambda _: None)
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", no_sleep)
     monkeypatch.setattr(
         executor,
         "get_open_position",
         lambda _symbol: {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
     )
-    monkeypatch.setattr(executor, "get_reference_price", lambda _symbol, _side: None)
+    monkeypatch.setattr(executor, "_fetch_ticker_payload", lambda _symbol: {})
     monkeypatch.setattr(executor, "get_order_book", lambda _symbol, limit=20: None)
 
     result = executor.close_position_adaptive(
@@ -152,13 +239,13 @@ def test_close_position_adaptive_stops_on_retry_cap(monkeypatch):
             }
         },
     )
-    monkeypatch.setattr("grvt_bot.core.executor.time.sleep", lambda _: None)
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", no_sleep)
     monkeypatch.setattr(
         executor,
         "get_open_position",
         lambda _symbol: {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
     )
-    monkeypatch.setattr(executor, "get_reference_price", lambda _symbol, _side: None)
+    monkeypatch.setattr(executor, "_fetch_ticker_payload", lambda _symbol: {})
     monkeypatch.setattr(executor, "get_order_book", lambda _symbol, limit=20: None)
 
     result = executor.close_position_adaptive(
@@ -172,6 +259,60 @@ def test_close_position_adaptive_stops_on_retry_cap(monkeypatch):
     assert result["code"] == "CLOSE_TIMEOUT"
 
 
+def test_close_position_adaptive_async_yields_to_event_loop(monkeypatch):
+    executor, cfg = build_executor(monkeypatch)
+    ticks = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(_seconds):
+        ticks.append("close")
+        await real_sleep(0)
+
+    positions = [
+        {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
+        None,
+    ]
+    monkeypatch.setattr(
+        executor,
+        "get_open_position",
+        lambda _symbol: positions.pop(0) if positions else None,
+    )
+    monkeypatch.setattr(
+        executor,
+        "_fetch_ticker_payload",
+        lambda _symbol: {"best_ask_price": 100.0, "best_bid_price": 99.9},
+    )
+    monkeypatch.setattr(
+        executor,
+        "get_order_book",
+        lambda _symbol, limit=20: {"asks": [(100.0, 3.0)], "bids": [(99.9, 2.0)]},
+    )
+    monkeypatch.setattr(executor, "get_market_limits", lambda _symbol: {"min_qty": 0.01, "base_decimals": 3})
+    monkeypatch.setattr(executor, "place_market_order", lambda **_kwargs: {"id": "ord-1"})
+
+    async def heartbeat():
+        ticks.append("heartbeat")
+
+    async def run():
+        close_task = asyncio.create_task(
+            executor.close_position_adaptive_async(
+                symbol="PAXG_USDT_Perp",
+                side="buy",
+                remaining_qty=1.0,
+                config=cfg,
+            )
+        )
+        heartbeat_task = asyncio.create_task(heartbeat())
+        result = await close_task
+        await heartbeat_task
+        return result
+
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", recording_sleep)
+    result = asyncio.run(run())
+    assert result["code"] == "CLOSE_SUCCESS"
+    assert ticks.index("heartbeat") < ticks.index("close")
+
+
 def test_flatten_all_positions_uses_adaptive_close(monkeypatch):
     executor, cfg = build_executor(monkeypatch)
     monkeypatch.setattr(
@@ -194,3 +335,127 @@ def test_flatten_all_positions_uses_adaptive_close(monkeypatch):
     assert calls[0]["side"] == "sell"
     assert calls[0]["remaining_qty"] == 0.5
     assert calls[0]["config"] is cfg
+
+
+def test_close_retry_delay_backs_off_with_full_jitter():
+    fixed = CloseSettings.from_config(
+        DummyConfig(
+            {
+                "execution": {
+                    "close_retry_interval_seconds": 2,
+                    "close_retry_cap_seconds": 16,
+                    "close_retry_jitter": False,
+                }
+            }
+        )
+    )
+    assert [fixed.retry_delay(failures) for failures in (1, 2, 3, 4, 10)] == [2.0, 4.0, 8.0, 16.0, 16.0]
+
+    jittered = CloseSettings.from_config(DummyConfig({"execution": {"close_retry_cap_seconds": 16}}))
+    delays = [jittered.retry_delay(failures) for failures in range(1, 50)]
+    assert all(0.0 <= delay <= 16.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_close_settles_fixed_interval_after_slices_and_backs_off_on_failures(monkeypatch):
+    executor, cfg = build_executor(
+        monkeypatch, {"execution": {"close_retry_interval_seconds": 2, "close_retry_jitter": False}}
+    )
+    sleeps = []
+
+    async def record_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("grvt_bot.core.executor.asyncio.sleep", record_sleep)
+    positions = [
+        {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
+        {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 0.8},
+        {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 0.6},
+        None,
+    ]
+    monkeypatch.setattr(
+        executor,
+        "get_open_position",
+        lambda _symbol: positions.pop(0) if positions else None,
+    )
+    monkeypatch.setattr(
+        executor,
+        "_fetch_ticker_payload",
+        lambda _symbol: {"best_ask_price": 100.0, "best_bid_price": 99.9},
+    )
+    monkeypatch.setattr(
+        executor,
+        "get_order_book",
+        lambda _symbol, limit=20: {"asks": [(100.0, 0.3)], "bids": [(99.9, 0.3)]},
+    )
+    monkeypatch.setattr(executor, "get_market_limits", lambda _symbol: {"min_qty": 0.01, "base_decimals": 3})
+    monkeypatch.setattr(executor, "place_market_order", lambda **kwargs: {"id": "ord"})
+
+    result = executor.close_position_adaptive(
+        symbol="PAXG_USDT_Perp", side="buy", remaining_qty=1.0, config=cfg
+    )
+    assert result["code"] == "CLOSE_SUCCESS"
+    # Slices that made progress wait the configured interval, never a growing backoff.
+    assert sleeps == [2.0, 2.0, 2.0]
+
+    sleeps.clear()
+    monkeypatch.setattr(
+        executor,
+        "get_open_position",
+        lambda _symbol: {"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 1.0},
+    )
+    monkeypatch.setattr(executor, "get_order_book", lambda _symbol, limit=20: {"asks": [], "bids": []})
+    result = executor.close_position_adaptive(
+        symbol="PAXG_USDT_Perp", side="buy", remaining_qty=1.0, config=cfg
+    )
+    assert result["code"] == "CLOSE_NO_PROGRESS"
+    assert sleeps == [2.0, 4.0]
+
+
+def test_fetch_account_snapshot_gathers_position_ticker_and_balance(monkeypatch):
+    executor, _cfg = build_executor(monkeypatch)
+    position = {"symbol": "PAXG_USDT_Perp", "side": "buy", "amount_base": 0.5}
+    monkeypatch.setattr(executor, "get_open_position", lambda _symbol: position)
+    monkeypatch.setattr(executor, "get_account_summary", lambda: {"total": {"USDT": 1000.0}})
+
+    def failing_ticker(_symbol):
+        raise RuntimeError("ticker down")
+
+    monkeypatch.setattr(executor, "_fetch_ticker_payload", failing_ticker)
+
+    snapshot = executor.fetch_account_snapshot("PAXG_USDT_Perp")
+    assert snapshot == {"position": position, "ticker": {}, "balance": {"total": {"USDT": 1000.0}}}
+
+    no_balance = executor.fetch_account_snapshot("PAXG_USDT_Perp", include_balance=False)
+    assert no_balance["balance"] is None
+
+    def failing_balance():
+        raise RuntimeError("balance down")
+
+    monkeypatch.setattr(executor, "get_account_summary", failing_balance)
+    snapshot = executor.fetch_account_snapshot("PAXG_USDT_Perp")
+    assert snapshot["position"] == position
+    assert snapshot["balance"] is None
+
+
+def test_fetch_account_snapshot_includes_order_book_when_requested(monkeypatch):
+    executor, _cfg = build_executor(monkeypatch)
+    book = {"asks": [(100.0, 3.0)], "bids": [(99.9, 2.0)]}
+    monkeypatch.setattr(executor, "get_open_position", lambda _symbol: None)
+    monkeypatch.setattr(executor, "_fetch_ticker_payload", lambda _symbol: {"last_price": 100.0})
+    monkeypatch.setattr(executor, "get_order_book", lambda _symbol, limit=20: book)
+
+    snapshot = asyncio.run(
+        executor.fetch_account_snapshot_async("PAXG_USDT_Perp", include_balance=False, order_book_levels=5)
+    )
+    assert snapshot["order_book"] == book
+    assert "order_book" not in executor.fetch_account_snapshot("PAXG_USDT_Perp", include_balance=False)
+
+    def failing_book(_symbol, limit=20):
+        raise RuntimeError("book down")
+
+    monkeypatch.setattr(executor, "get_order_book", failing_book)
+    snapshot = asyncio.run(
+        executor.fetch_account_snapshot_async("PAXG_USDT_Perp", include_balance=False, order_book_levels=5)
+    )
+    assert snapshot["order_book"] is None
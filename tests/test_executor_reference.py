@@ -1,3 +1,5 @@
+import pytest
+
 from grvt_bot.core.executor import GRVTExecutor
 
 
@@ -34,6 +36,28 @@ class DummyClient:
     def fetch_order_book(self, symbol, limit=None):
         return self.order_book_payload
 
+    def fetch_ohlcv(self, symbol, timeframe, limit=None):
+        return {
+            "result": [
+                {
+                    "open_time": "1700000060000000000",
+                    "open": "2",
+                    "high": "3",
+                    "low": "1",
+                    "close": "2.5",
+                    "volume": "7",
+                },
+                {
+                    "open_time": "1700000000000000000",
+                    "open": "1",
+                    "high": "2",
+                    "low": "0.5",
+                    "close": "1.5",
+                    "volume_u": "4",
+                },
+            ]
+        }
+
 
 def build_executor(monkeypatch):
     monkeypatch.setattr(GRVTExecutor, "initialize_client", lambda self: None)
@@ -43,6 +67,7 @@ def build_executor(monkeypatch):
 
 
 def test_reference_price_fallback_chain(monkeypatch):
+    monkeypatch.setattr(GRVTExecutor, "REFERENCE_PRICE_TTL_SECONDS", 0.0)
     executor = build_executor(monkeypatch)
 
     executor.client.ticker_payload = {"best_ask_price": "101.5", "last_price": "100"}
@@ -58,6 +83,19 @@ def test_reference_price_fallback_chain(monkeypatch):
     assert executor.get_reference_price("PAXG_USDT_Perp", "buy") == 99.7
 
 
+def test_reference_price_reused_within_ttl(monkeypatch):
+    executor = build_executor(monkeypatch)
+    executor.client.ticker_payload = {"best_ask_price": "101.5", "best_bid_price": "99.5"}
+    assert executor.get_reference_price("PAXG_USDT_Perp", "buy") == 101.5
+
+    executor.client.ticker_payload = {"best_ask_price": "102.5", "best_bid_price": "98.5"}
+    assert executor.get_reference_price("PAXG_USDT_Perp", "buy") == 101.5
+    assert executor.get_reference_price("PAXG_USDT_Perp", "sell") == 98.5
+
+    executor._reference_prices.clear()
+    assert executor.get_reference_price("PAXG_USDT_Perp", "buy") == 102.5
+
+
 def test_get_market_limits_reads_min_size(monkeypatch):
     executor = build_executor(monkeypatch)
     limits = executor.get_market_limits("PAXG_USDT_Perp")
@@ -73,3 +111,108 @@ def test_get_order_book_normalizes_levels(monkeypatch):
     assert order_book is not None
     assert order_book["bids"][0] == (99.5, 1.2)
     assert order_book["asks"][0] == (100.5, 0.8)
+
+
+def test_get_market_limits_falls_back_to_fetch_markets(monkeypatch):
+    executor = build_executor(monkeypatch)
+
+    def failing_load_markets():
+        raise RuntimeError("load_markets unavailable")
+
+    executor.client.load_markets = failing_load_markets
+    limits = executor.get_market_limits("PAXG_USDT_Perp")
+    assert limits is not None
+    assert limits["min_qty"] == 0.01
+
+
+def test_get_market_limits_skips_fetch_markets_when_load_succeeds(monkeypatch):
+    executor = build_executor(monkeypatch)
+
+    fetch_calls = []
+    executor.client.fetch_markets = lambda: fetch_calls.append(1) or []
+    limits = executor.get_market_limits("PAXG_USDT_Perp")
+    assert limits is not None
+    assert limits["min_qty"] == 0.01
+    assert fetch_calls == []
+
+
+class FakeBookStream:
+    def __init__(self, feed):
+        self.feed = feed
+
+    def snapshot(self, symbol, max_age_seconds):
+        return self.feed
+
+    def ticker(self, symbol, max_age_seconds):
+        return self.feed
+
+
+def test_close_order_book_prefers_fresh_stream_then_rest(monkeypatch):
+    executor = build_executor(monkeypatch)
+
+    executor._book_stream = FakeBookStream(
+        {"bids": [{"price": "99.9", "size": "2"}], "asks": [{"price": "100.1", "size": "1"}]}
+    )
+    order_book = executor._close_order_book("PAXG_USDT_Perp", 20)
+    assert order_book["asks"][0] == (100.1, 1.0)
+
+    # Stale/missing stream snapshot falls back to REST.
+    executor._book_stream = FakeBookStream(None)
+    order_book = executor._close_order_book("PAXG_USDT_Perp", 20)
+    assert order_book["asks"][0] == (100.5, 0.8)
+
+
+def test_fetch_ohlcv_array_matches_list_parser(monkeypatch):
+    pytest.importorskip("numpy")
+    executor = build_executor(monkeypatch)
+
+    candles = executor.fetch_ohlcv_array("PAXG_USDT_Perp", "1m", limit=2)
+    rows = executor.fetch_ohlcv("PAXG_USDT_Perp", "1m", limit=2)
+
+    assert candles["ts"].tolist() == [1_700_000_000_000, 1_700_000_060_000]
+    assert [list(row)[1:] for row in candles.tolist()] == [row[1:] for row in rows]
+    assert candles["v"].tolist() == [4.0, 7.0]
+
+
+def test_compiled_market_limits_cached_until_markets_reload(monkeypatch):
+    executor = build_executor(monkeypatch)
+
+    first = executor.get_market_limits_compiled("PAXG_USDT_Perp")
+    assert first is not None
+    assert first.min_qty == 0.01
+    assert executor.get_market_limits_compiled("PAXG_USDT_Perp") is first
+
+    assert executor.get_market_limits("PAXG_USDT_Perp") is executor.get_market_limits("PAXG_USDT_Perp")
+
+    executor.client.markets_payload["PAXG_USDT_Perp"]["min_size"] = "0.05"
+    executor._markets_cache = {}
+    reloaded = executor.get_market_limits_compiled("PAXG_USDT_Perp")
+    assert reloaded is not first
+    assert reloaded.min_qty == 0.05
+
+
+def test_market_price_reuses_detected_ticker_key(monkeypatch):
+    executor = build_executor(monkeypatch)
+
+    executor.client.ticker_payload = {"last_price": "100", "mark_price": "99"}
+    assert executor.get_market_price("PAXG_USDT_Perp") == 100.0
+    assert executor._price_key == "last_price"
+
+    executor.client.ticker_payload = {"last": "101", "last_price": "102"}
+    assert executor.get_market_price("PAXG_USDT_Perp") == 102.0
+
+    executor.client.ticker_payload = {"mark_price": "98"}
+    assert executor.get_market_price("PAXG_USDT_Perp") == 98.0
+    assert executor._price_key == "mark_price"
+
+
+def test_market_price_prefers_fresh_ticker_stream_then_rest(monkeypatch):
+    executor = build_executor(monkeypatch)
+    executor.client.ticker_payload = {"last_price": "100"}
+
+    executor._ticker_stream = FakeBookStream({"last_price": "100.4"})
+    assert executor.get_market_price("PAXG_USDT_Perp") == 100.4
+
+    # Stale/missing streamed ticker falls back to REST.
+    executor._ticker_stream = FakeBookStream(None)
+    assert executor.get_market_price("PAXG_USDT_Perp") == 100.0
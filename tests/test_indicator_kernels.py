@@ -0,0 +1,37 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from grvt_bot.strategies._kernels import rolling_mean_std, wilder_atr  # noqa: E402
+
+
+def test_wilder_atr_seeds_with_sma_then_smooths():
+    high = np.array([11.0, 12.0, 13.0, 15.0])
+    low = np.array([9.0, 10.0, 11.0, 12.0])
+    close = np.array([10.0, 11.0, 12.0, 14.0])
+
+    atr = wilder_atr(high, low, close, 2)
+
+    assert np.isnan(atr[0])
+    # true ranges: 2, 2, 2, 3
+    assert atr[1] == pytest.approx(2.0)
+    assert atr[2] == pytest.approx(2.0)
+    assert atr[3] == pytest.approx(2.5)
+
+
+def test_wilder_atr_short_series_is_all_nan():
+    values = np.array([1.0, 2.0])
+
+    assert np.isnan(wilder_atr(values, values, values, 3)).all()
+
+
+def test_rolling_mean_std_matches_numpy_windows():
+    values = np.random.default_rng(3).normal(2000, 5, 50)
+    windows = np.lib.stride_tricks.sliding_window_view(values, 20)
+
+    mean, std = rolling_mean_std(values, 20)
+
+    assert mean.shape == (31,)
+    np.testing.assert_allclose(mean, windows.mean(axis=1))
+    np.testing.assert_allclose(std, windows.std(axis=1, ddof=0))
+    assert rolling_mean_std(values[:5], 20)[0].size == 0
@@ -0,0 +1,24 @@
+import logging
+
+from grvt_bot.utils.logger import setup_logger
+
+
+def test_setup_logger_reuses_configured_logger():
+    first = setup_logger("grvt_bot.test_memo", log_file=None, quiet_third_party=False)
+    handlers = list(first.handlers)
+
+    second = setup_logger("grvt_bot.test_memo", log_file=None, quiet_third_party=False)
+
+    assert second is first
+    assert second.handlers == handlers
+
+
+def test_setup_logger_reconfigures_on_new_settings():
+    setup_logger("grvt_bot.test_reconf", log_file=None, quiet_third_party=False)
+
+    logger = setup_logger(
+        "grvt_bot.test_reconf", log_file=None, level=logging.DEBUG, quiet_third_party=False
+    )
+
+    assert logger.level == logging.DEBUG
+    assert len(logger.handlers) == 1
@@ -0,0 +1,125 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from grvt_bot.strategies import paxg_mean_reversion_strategy as paxg_module  # noqa: E402
+from grvt_bot.strategies.paxg_mean_reversion_strategy import (  # noqa: E402
+    PAXGMeanReversionStrategy,
+)
+
+
+CONFIG = {"strategy": {"bb_window": 20, "bb_std": 2.0, "atr_window": 14}}
+
+
+def build_frame(n=60):
+    rng = np.random.default_rng(7)
+    close = 2000 + rng.normal(0, 5, n).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 1, n),
+            "high": close + np.abs(rng.normal(0, 3, n)),
+            "low": close - np.abs(rng.normal(0, 3, n)),
+            "close": close,
+        }
+    )
+
+
+def test_indicators_match_pandas_reference():
+    frame = build_frame()
+    strategy = PAXGMeanReversionStrategy(CONFIG)
+    strategy.update_market_data(frame)
+
+    close = frame["close"]
+    mid = close.rolling(20).mean().iloc[-1]
+    std = close.rolling(20).std(ddof=0).iloc[-1]
+    prev_close = close.shift(1)
+    high, low = frame["high"], frame["low"]
+    tr = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1)
+    atr = tr.iloc[:14].mean()
+    for value in tr.iloc[14:]:
+        atr = (atr * 13 + value) / 14
+
+    assert strategy.last_indicators["bb_mid"] == pytest.approx(mid)
+    assert strategy.last_indicators["bb_high"] == pytest.approx(mid + 2 * std)
+    assert strategy.last_indicators["bb_low"] == pytest.approx(mid - 2 * std)
+    assert strategy.last_indicators["atr"] == pytest.approx(atr)
+
+
+def test_appended_candles_match_batch_recompute():
+    frame = build_frame()
+    batch = PAXGMeanReversionStrategy(CONFIG)
+    batch.update_market_data(frame)
+
+    streamed = PAXGMeanReversionStrategy(CONFIG)
+    streamed.update_market_data(frame.iloc[:5])
+    for row in frame.iloc[5:].itertuples(index=False):
+        streamed.append_candle(row.open, row.high, row.low, row.close)
+
+    for key, value in batch.last_indicators.items():
+        assert streamed.last_indicators[key] == pytest.approx(value)
+
+
+def test_single_row_with_same_timestamp_replaces_newest_candle():
+    frame = build_frame()
+    frame["timestamp"] = pd.date_range("2024-01-01", periods=len(frame), freq="15min")
+    streamed = PAXGMeanReversionStrategy(CONFIG)
+    streamed.update_market_data(frame.iloc[:-1])
+
+    # The newest bar is sent while still forming, then again once closed.
+    forming = frame.iloc[-1:].copy()
+    forming[["open", "high", "low", "close"]] += 25.0
+    streamed.update_market_data(forming)
+    streamed.update_market_data(frame.iloc[-1:])
+
+    appended_once = PAXGMeanReversionStrategy(CONFIG)
+    appended_once.update_market_data(frame.iloc[:-1])
+    appended_once.update_market_data(frame.iloc[-1:])
+    assert streamed._head == appended_once._head
+
+    batch = PAXGMeanReversionStrategy(CONFIG)
+    batch.update_market_data(frame)
+    for key, value in batch.last_indicators.items():
+        assert streamed.last_indicators[key] == pytest.approx(value)
+
+
+def test_check_exit_uses_cached_middle_band():
+    strategy = PAXGMeanReversionStrategy(CONFIG)
+    assert strategy.check_exit(2000.0, {"side": "buy"}) is None
+
+    strategy.update_market_data(build_frame())
+    mid = strategy.last_indicators["bb_mid"]
+
+    assert strategy.check_exit(mid + 1, {}) is None
+    assert strategy.check_exit(mid + 1, {"side": "LONG"})["side"] == "sell"
+    assert strategy.check_exit(mid - 1, {"side": "short"})["side"] == "buy"
+    assert strategy.check_exit(mid - 1, {"side": "buy"}) is None
+
+
+def test_polars_frames_and_band_path_match_numpy(monkeypatch):
+    pl = pytest.importorskip("polars")
+    frame = build_frame(200)
+    reference = PAXGMeanReversionStrategy(CONFIG)
+    reference.update_market_data(frame)
+
+    monkeypatch.setattr(PAXGMeanReversionStrategy, "POLARS_MIN_ROWS", 1)
+    strategy = PAXGMeanReversionStrategy(CONFIG)
+    strategy.update_market_data(pl.from_pandas(frame))
+
+    for key, value in reference.last_indicators.items():
+        assert strategy.last_indicators[key] == pytest.approx(value)
+
+
+def test_compiled_band_path_matches_numpy(monkeypatch):
+    frame = build_frame()
+    reference = PAXGMeanReversionStrategy(CONFIG)
+    reference.update_market_data(frame)
+
+    monkeypatch.setattr(paxg_module, "NUMBA_AVAILABLE", True)
+    strategy = PAXGMeanReversionStrategy(CONFIG)
+    strategy.update_market_data(frame)
+
+    for key, value in reference.last_indicators.items():
+        assert strategy.last_indicators[key] == pytest.approx(value)
@@ -0,0 +1,56 @@
+import random
+
+from grvt_bot.strategies.random_strategy import RandomStrategy
+
+
+class DummyConfig:
+    MAIN_LOOP_INTERVAL = 1
+    ORDER_SIZE_USDT = 250
+
+
+def test_choice_table_matches_signal_odds():
+    strategy = RandomStrategy(DummyConfig())
+
+    sides = [entry["side"] if entry else None for entry in strategy._choices]
+
+    assert len(sides) == 256
+    assert sides.count("buy") == 77
+    assert sides.count("sell") == 77
+    assert sides.count(None) == 102
+
+
+def test_signal_is_a_copy_of_the_template(monkeypatch):
+    strategy = RandomStrategy(DummyConfig())
+    monkeypatch.setattr(random, "getrandbits", lambda bits: 0)
+
+    signal = strategy.get_signal()
+    signal["amount_usdt"] = 1
+
+    assert signal["side"] == "buy"
+    assert strategy._choices[0]["amount_usdt"] == 250
+
+
+def test_throttle_uses_monotonic_clock(monkeypatch):
+    strategy = RandomStrategy(DummyConfig())
+    clock = {"now": 5.0}
+    monkeypatch.setattr("grvt_bot.strategies.random_strategy.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("grvt_bot.strategies.random_strategy.time.time", lambda: 0.0)
+    monkeypatch.setattr(random, "getrandbits", lambda bits: 255)
+
+    assert strategy.get_signal()["side"] == "sell"
+    clock["now"] = 30.0
+    assert strategy.get_signal() is None
+    clock["now"] = 65.0
+    assert strategy.get_signal()["side"] == "sell"
+
+
+def test_config_values_resolved_from_get_fallback():
+    class GetOnlyConfig:
+        def get(self, section, key, default=None):
+            return {"loop_interval": 2, "order_size_usdt": 75}.get(key, default)
+
+    strategy = RandomStrategy(GetOnlyConfig())
+
+    assert strategy.signal_interval == 120
+    assert strategy.order_size == 75
+    assert RandomStrategy(None).order_size == 500
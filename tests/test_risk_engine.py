@@ -1,31 +1,40 @@
-from grvt_bot.core.risk import RiskEngine
+import dataclasses
+
+import pytest
+
+from grvt_bot.core.risk import SIDE_INDEX, RiskEngine, compile_market_limits
 
 
 class DummyConfig:
     def __init__(self, values):
-        self.values = values
+        # Flat (section, key) table: one hash lookup per get; nested values such as
+        # risk.tracks stay whole.
+        self._flat = {
+            (section, key): value for section, sub in values.items() for key, value in sub.items()
+        }
 
     def get(self, section, key, default=None):
-        return self.values.get(section, {}).get(key, default)
+        return self._flat.get((section, key), default)
+
+    def set(self, section, key, value):
+        self._flat[(section, key)] = value
+
+
+RISK_VALUES = {
+    "active_track": "normal",
+    "fail_closed": True,
+    "threshold_action": "flatten_halt",
+    "risk_per_trade_pct": 0.25,
+    "min_notional_safety_factor": 1.05,
+    "tracks": {
+        "normal": {"max_drawdown_pct": 5.0, "profit_target_pct": 5.0},
+        "low_vol": {"max_drawdown_pct": 2.0, "profit_target_pct": 2.0},
+    },
+}
 
 
 def build_config(kill_switch=False):
-    return DummyConfig(
-        {
-            "risk": {
-                "active_track": "normal",
-                "fail_closed": True,
-                "kill_switch": kill_switch,
-                "threshold_action": "flatten_halt",
-                "risk_per_trade_pct": 0.25,
-                "min_notional_safety_factor": 1.05,
-                "tracks": {
-                    "normal": {"max_drawdown_pct": 5.0, "profit_target_pct": 5.0},
-                    "low_vol": {"max_drawdown_pct": 2.0, "profit_target_pct": 2.0},
-                },
-            }
-        }
-    )
+    return DummyConfig({"risk": {**RISK_VALUES, "kill_switch": kill_switch}})
 
 
 def test_kill_switch_blocks_entry():
@@ -41,44 +50,112 @@ def test_kill_switch_blocks_entry():
     assert decision.code == "KILL_SWITCH"
 
 
-def test_min_qty_violation_rejects_entry():
-    engine = RiskEngine(build_config())
+@pytest.fixture(scope="module")
+def engine():
+    """Shared engine for cases that only evaluate; tests that mutate config build their own."""
+    return RiskEngine(build_config())
+
+
+@pytest.mark.parametrize(
+    "amount_usdt,expected_code,expected_min_notional",
+    [
+        (10.0, "MIN_QTY_VIOLATION", None),  # qty=0.01 < min_qty 0.02
+        (20.0, "MIN_NOTIONAL_VIOLATION", 21.0),  # below 0.02*1000*1.05
+    ],
+)
+def test_entry_rejections(engine, amount_usdt, expected_code, expected_min_notional):
     decision = engine.evaluate_entry(
         side="buy",
-        amount_usdt=10.0,  # qty=0.01
+        amount_usdt=amount_usdt,
         reference_price=1000.0,
         market_limits={"min_qty": 0.02, "base_decimals": 4},
         is_halted=False,
     )
     assert decision.allowed is False
-    assert decision.code == "MIN_QTY_VIOLATION"
+    assert decision.code == expected_code
+    if expected_min_notional is not None:
+        assert decision.derived_min_notional_usdt == expected_min_notional
 
 
-def test_derived_min_notional_violation_rejects_entry():
-    engine = RiskEngine(build_config())
-    decision = engine.evaluate_entry(
-        side="buy",
-        amount_usdt=20.0,  # below derived min_notional (0.02*1000*1.05=21)
-        reference_price=1000.0,
-        market_limits={"min_qty": 0.02, "base_decimals": 4},
-        is_halted=False,
+@pytest.mark.parametrize(
+    "current_equity_usdt,expected_code",
+    [(940.0, "MAX_DRAWDOWN_HIT"), (1060.0, "PROFIT_TARGET_HIT")],
+)
+def test_threshold_triggers_flatten_halt(engine, current_equity_usdt, expected_code):
+    decision = engine.evaluate_thresholds(
+        current_equity_usdt=current_equity_usdt, baseline_equity_usdt=1000.0
     )
     assert decision.allowed is False
-    assert decision.code == "MIN_NOTIONAL_VIOLATION"
-    assert decision.derived_min_notional_usdt == 21.0
+    assert decision.code == expected_code
+    assert decision.action == "flatten_halt"
 
 
-def test_drawdown_threshold_triggers_flatten_halt():
-    engine = RiskEngine(build_config())
-    decision = engine.evaluate_thresholds(current_equity_usdt=940.0, baseline_equity_usdt=1000.0)
-    assert decision.allowed is False
+def test_refresh_picks_up_config_changes():
+    config = build_config()
+    engine = RiskEngine(config)
+    config.set("risk", "kill_switch", True)
+    config.set("risk", "active_track", "low_vol")
+
+    assert engine.kill_switch is False
+    engine.refresh()
+    assert engine.kill_switch is True
+
+    decision = engine.evaluate_thresholds(current_equity_usdt=975.0, baseline_equity_usdt=1000.0)
     assert decision.code == "MAX_DRAWDOWN_HIT"
-    assert decision.action == "flatten_halt"
 
 
-def test_profit_threshold_triggers_flatten_halt():
+def test_compiled_market_limits_match_raw_limits():
     engine = RiskEngine(build_config())
-    decision = engine.evaluate_thresholds(current_equity_usdt=1060.0, baseline_equity_usdt=1000.0)
-    assert decision.allowed is False
-    assert decision.code == "PROFIT_TARGET_HIT"
-    assert decision.action == "flatten_halt"
+    raw = {"min_qty": "0.02", "base_decimals": "4"}
+    compiled = compile_market_limits(raw)
+    assert compiled.min_qty == 0.02
+    assert compiled.base_decimals == 4
+
+    for amount_usdt in (10.0, 20.0, 50.0):
+        from_raw = engine.evaluate_entry("buy", amount_usdt, 1000.0, raw, is_halted=False)
+        from_compiled = engine.evaluate_entry("buy", amount_usdt, 1000.0, compiled, is_halted=False)
+        assert from_raw == from_compiled
+
+    missing = engine.evaluate_entry("buy", 50.0, 1000.0, compile_market_limits({}), is_halted=False)
+    assert missing.code == "MIN_QTY_MISSING"
+
+
+def test_threshold_ok_path_returns_shared_decision_unless_meta_requested():
+    engine = RiskEngine(build_config())
+    first = engine.evaluate_thresholds(current_equity_usdt=1010.0, baseline_equity_usdt=1000.0)
+    second = engine.evaluate_thresholds(current_equity_usdt=990.0, baseline_equity_usdt=1000.0)
+    assert first.allowed is True and first.code == "OK"
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.action = "flatten_halt"
+    assert second.action == "allow"
+
+    detailed = engine.evaluate_thresholds(
+        current_equity_usdt=1010.0, baseline_equity_usdt=1000.0, want_meta=True
+    )
+    assert detailed is not first
+    assert abs(detailed.meta["pnl_pct"] - 1.0) < 1e-9
+
+
+def test_evaluate_entry_fast_matches_full_evaluation():
+    engine = RiskEngine(build_config())
+    compiled = compile_market_limits({"min_qty": 0.02, "base_decimals": 4})
+
+    for amount_usdt in (10.0, 20.0, 50.0):
+        fast = engine.evaluate_entry_fast(SIDE_INDEX["sell"], amount_usdt, 1000.0, compiled, False)
+        full = engine.evaluate_entry("sell", amount_usdt, 1000.0, compiled, is_halted=False)
+        assert fast == full
+
+    allowed = engine.evaluate_entry_fast(SIDE_INDEX["buy"], 50.0, 1000.0, compiled, False)
+    assert allowed.allowed is True
+    assert allowed.meta == {"min_qty": 0.02, "reference_price": 1000.0}
+
+    halted = engine.evaluate_entry_fast(SIDE_INDEX["buy"], 50.0, 1000.0, compiled, True)
+    assert halted.code == "HALTED"
+
+
+def test_compile_market_limits_rejects_boolean_min_qty():
+    assert compile_market_limits({"min_qty": False}).min_qty_issue[0] == "MIN_QTY_INVALID"
+    assert compile_market_limits({"min_qty": True}).min_qty_issue[0] == "MIN_QTY_INVALID"
+    assert compile_market_limits({"min_qty": 0}).min_qty_issue[0] == "MIN_QTY_MISSING"
+    assert compile_market_limits({"min_qty": ""}).min_qty_issue[0] == "MIN_QTY_MISSING"
@@ -1,60 +1,83 @@
+import asyncio
 import json
-import shutil
-import uuid
-from pathlib import Path
 
 import pytest
 
 from grvt_bot.core.runtime_lock import RuntimeLock
 
+# RuntimeLock holds OS-level locks keyed on the process; keep these on one xdist worker.
+pytestmark = pytest.mark.xdist_group("runtime_lock")
 
-def _make_tmp_dir() -> Path:
-    path = Path(f".runtime_lock_test_{uuid.uuid4().hex}")
-    path.mkdir(parents=True, exist_ok=True)
-    return path
 
+def test_runtime_lock_acquire_release(tmp_path):
+    lock_path = tmp_path / "runtime.lock"
+    lock = RuntimeLock(str(lock_path))
+    lock.acquire()
+    assert lock_path.exists()
+    lock.release()
+    assert not lock_path.exists()
 
-def test_runtime_lock_acquire_release():
-    tmp_dir = _make_tmp_dir()
-    try:
-        lock_path = tmp_dir / "runtime.lock"
-        lock = RuntimeLock(str(lock_path))
-        lock.acquire()
-        assert lock_path.exists()
-        lock.release()
-        assert not lock_path.exists()
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-
-
-def test_runtime_lock_overwrites_stale_lock():
-    tmp_dir = _make_tmp_dir()
-    try:
-        lock_path = tmp_dir / "runtime.lock"
-        lock_path.write_text(
-            json.dumps({"pid": 999999, "started_at": "old"}),
-            encoding="utf-8",
-        )
-        lock = RuntimeLock(str(lock_path))
+
+def test_runtime_lock_overwrites_stale_lock(tmp_path):
+    lock_path = tmp_path / "runtime.lock"
+    lock_path.write_text(
+        json.dumps({"pid": 999999, "started_at": "old"}),
+        encoding="utf-8",
+    )
+    lock = RuntimeLock(str(lock_path))
+    lock.acquire()
+    payload = json.loads(lock_path.read_text(encoding="utf-8"))
+    assert int(payload["pid"]) > 0
+    lock.release()
+
+
+def test_runtime_lock_blocks_if_other_pid_alive(tmp_path, monkeypatch):
+    lock_path = tmp_path / "runtime.lock"
+    lock_path.write_text(
+        json.dumps({"pid": 123456, "started_at": "running"}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(RuntimeLock, "_is_pid_alive", staticmethod(lambda pid: True))
+    lock = RuntimeLock(str(lock_path))
+    with pytest.raises(RuntimeError):
         lock.acquire()
-        payload = json.loads(lock_path.read_text(encoding="utf-8"))
-        assert int(payload["pid"]) > 0
-        lock.release()
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-
-
-def test_runtime_lock_blocks_if_other_pid_alive(monkeypatch):
-    tmp_dir = _make_tmp_dir()
-    try:
-        lock_path = tmp_dir / "runtime.lock"
-        lock_path.write_text(
-            json.dumps({"pid": 123456, "started_at": "running"}),
-            encoding="utf-8",
-        )
-        monkeypatch.setattr(RuntimeLock, "_is_pid_alive", staticmethod(lambda pid: True))
-        lock = RuntimeLock(str(lock_path))
+
+
+def test_runtime_lock_held_by_os_lock_blocks_second_holder(tmp_path):
+    lock_path = tmp_path / "runtime.lock"
+    first = RuntimeLock(str(lock_path))
+    first.acquire()
+
+    second = RuntimeLock(str(lock_path))
+    with pytest.raises(RuntimeError):
+        second.acquire()
+    assert second.acquired is False
+
+    first.release()
+    second.acquire()
+    assert second.acquired is True
+    second.release()
+    assert not lock_path.exists()
+
+
+def test_runtime_lock_acquire_async_waits_for_release(tmp_path):
+    lock_path = tmp_path / "runtime.lock"
+    holder = RuntimeLock(str(lock_path))
+    holder.acquire()
+    waiter = RuntimeLock(str(lock_path))
+
+    async def scenario():
         with pytest.raises(RuntimeError):
-            lock.acquire()
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+            await waiter.acquire_async(timeout=0.1, poll_interval=0.02)
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            holder.release()
+
+        release_task = asyncio.create_task(release_later())
+        await waiter.acquire_async(timeout=2.0, poll_interval=0.01)
+        await release_task
+
+    asyncio.run(scenario())
+    assert waiter.acquired is True
+    waiter.release()
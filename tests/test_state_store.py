@@ -1,8 +1,11 @@
-import shutil
-import uuid
-from pathlib import Path
+import asyncio
+import json
+import time
 
-from grvt_bot.core.state import StateStore
+import pytest
+
+from grvt_bot.core import state as state_module
+from grvt_bot.core.state import BatchedStateStore, StateStore
 
 
 class DummyExecutor:
@@ -13,55 +16,217 @@ class DummyExecutor:
         return self.position
 
 
-def test_state_persistence_and_recovery():
-    tmp_dir = Path(f".state_test_{uuid.uuid4().hex}")
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    try:
-        state_path = tmp_dir / "runtime_state.json"
-        store = StateStore(str(state_path))
-
-        state = store.load()
-        assert state["open_position"] is None
-        assert state["halted"] is False
-        assert state["pending_action"] is None
-        assert state["close_attempt_count"] == 0
-        assert state["last_close_reason"] == ""
-
-        state["open_position"] = {
-            "side": "buy",
-            "amount_base": 0.123,
-            "entry_price": 2000.0,
-        }
-        store.save(state)
+def test_state_persistence_and_recovery(tmp_path):
+    state_path = tmp_path / "runtime_state.json"
+    store = StateStore(str(state_path))
+
+    state = store.load()
+    assert state["open_position"] is None
+    assert state["halted"] is False
+    assert state["pending_action"] is None
+    assert state["close_attempt_count"] == 0
+    assert state["last_close_reason"] == ""
+
+    state["open_position"] = {
+        "side": "buy",
+        "amount_base": 0.123,
+        "entry_price": 2000.0,
+    }
+    store.save(state)
+
+    # Simulate process restart.
+    recovered = StateStore(str(state_path)).load()
+    assert recovered["open_position"]["side"] == "buy"
+    assert recovered["open_position"]["amount_base"] == 0.123
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_state_round_trips_floats_losslessly(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and state_module.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(state_module, "orjson", None)
+
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    state = store.load()
+    state["baseline_equity_usdt"] = 0.1 + 0.2
+    state["open_position"] = {"side": "sell", "amount_base": 1e-17, "entry_price": 2345.678901234567}
+    state["last_candle_open_time_ms"] = 2**53 + 1
+    store.save(state)
+
+    recovered = StateStore(store.path).load()
+    assert recovered["baseline_equity_usdt"] == 0.1 + 0.2
+    assert recovered["open_position"] == state["open_position"]
+    assert recovered["last_candle_open_time_ms"] == 2**53 + 1
+
+
+def test_reconcile_updates_state_from_exchange(tmp_path):
+    state_path = tmp_path / "runtime_state.json"
+    store = StateStore(str(state_path))
+
+    state = store.load()
+    state["open_position"] = None
+    store.save(state)
+
+    exchange_position = {
+        "symbol": "PAXG_USDT_Perp",
+        "side": "sell",
+        "amount_base": 0.5,
+    }
+    result = store.reconcile(DummyExecutor(exchange_position), "PAXG_USDT_Perp")
+
+    assert result.mismatch is True
+    assert result.state["open_position"]["side"] == "sell"
+    assert result.state["open_position"]["amount_base"] == 0.5
+
+
+def test_reconcile_uses_injected_snapshot(tmp_path):
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    snapshot = {
+        "position": {"symbol": "PAXG_USDT_Perp", "side": "buy", "amount_base": 0.25},
+        "ticker": {},
+        "balance": None,
+    }
+    executor = DummyExecutor({"symbol": "PAXG_USDT_Perp", "side": "sell", "amount_base": 9.0})
+
+    result = store.reconcile(executor, "PAXG_USDT_Perp", snapshot=snapshot)
+
+    assert result.mismatch is True
+    assert result.state["open_position"]["side"] == "buy"
+    assert result.state["open_position"]["amount_base"] == 0.25
+
+
+def test_load_reads_legacy_pretty_printed_state(tmp_path):
+    state_path = tmp_path / "runtime_state.json"
+    state_path.write_text(
+        json.dumps({"halted": True, "baseline_equity_usdt": float("nan")}, indent=2),
+        encoding="utf-8",
+    )
+    store = StateStore(str(state_path))
+
+    state = store.load()
+    assert state["halted"] is True
+    assert state["open_position"] is None
+
+    store.save(state)
+    assert json.loads(state_path.read_text(encoding="utf-8"))["halted"] is True
+
+
+def test_unchanged_state_is_not_rewritten(tmp_path, monkeypatch):
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    store.load()
 
-        # Simulate process restart.
-        recovered = StateStore(str(state_path)).load()
-        assert recovered["open_position"]["side"] == "buy"
-        assert recovered["open_position"]["amount_base"] == 0.123
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+    writes = []
+    original_write = store._write
 
+    def counting_write(state):
+        writes.append(state)
+        return original_write(state)
 
-def test_reconcile_updates_state_from_exchange():
-    tmp_dir = Path(f".state_test_{uuid.uuid4().hex}")
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    try:
-        state_path = tmp_dir / "runtime_state.json"
-        store = StateStore(str(state_path))
+    monkeypatch.setattr(store, "_write", counting_write)
 
-        state = store.load()
-        state["open_position"] = None
+    state = store.load()
+    store.save(state)
+    assert len(writes) == 0
+
+    state["halted"] = True
+    store.save(state)
+    assert len(writes) == 1
+    assert store.flush() is None
+    assert len(writes) == 1
+    assert StateStore(store.path).load()["halted"] is True
+
+
+def test_setters_debounce_writes_until_flush(tmp_path, monkeypatch):
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    store.load()  # writes the initial file, starting the debounce window
+    monkeypatch.setattr(StateStore, "SAVE_DEBOUNCE_SECONDS", 60.0)
+
+    state = store.set_last_candle_open_time_ms(1_700_000_000_000)
+    store.set_baseline_equity(1234.5)
+    assert state["last_candle_open_time_ms"] == 1_700_000_000_000
+    assert store.dirty is True
+    assert StateStore(store.path).load()["last_candle_open_time_ms"] is None
+
+    store.flush()
+    assert store.dirty is False
+    recovered = StateStore(store.path).load()
+    assert recovered["last_candle_open_time_ms"] == 1_700_000_000_000
+    assert recovered["baseline_equity_usdt"] == 1234.5
+
+
+def test_set_halted_writes_immediately_inside_debounce_window(tmp_path, monkeypatch):
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    store.load()
+    monkeypatch.setattr(StateStore, "SAVE_DEBOUNCE_SECONDS", 60.0)
+
+    store.set_last_candle_open_time_ms(1_700_000_000_000)
+    store.set_halted(True, "test")
+    assert store.dirty is False
+    recovered = StateStore(store.path).load()
+    assert recovered["halted"] is True
+    assert recovered["halt_reason"] == "test"
+    # Pending debounced fields ride along with the halt write.
+    assert recovered["last_candle_open_time_ms"] == 1_700_000_000_000
+
+
+def test_save_async_writes_in_submission_order(tmp_path):
+    store = StateStore(str(tmp_path / "runtime_state.json"))
+    state = store.load()
+
+    async def save_many():
+        saves = []
+        for ts_ms in range(5):
+            state["last_candle_open_time_ms"] = ts_ms
+            saves.append(store.save_async(state))
+        return await asyncio.gather(*saves)
+
+    results = asyncio.run(save_many())
+    assert [r["last_candle_open_time_ms"] for r in results] == [0, 1, 2, 3, 4]
+    assert StateStore(store.path).load()["last_candle_open_time_ms"] == 4
+
+
+def test_batched_save_coalesces(tmp_path, monkeypatch):
+    store = BatchedStateStore(str(tmp_path / "runtime_state.json"), debounce_ms=60_000)
+    state = store.load()
+
+    writes = []
+    original_write = store._write
+
+    def counting_write(state):
+        writes.append(state)
+        return original_write(state)
+
+    monkeypatch.setattr(store, "_write", counting_write)
+
+    for ts_ms in range(50):
+        state["last_candle_open_time_ms"] = ts_ms
         store.save(state)
+    assert writes == []
+    assert store.load()["last_candle_open_time_ms"] == 49
+
+    store.close()
+    assert len(writes) == 1
+    assert StateStore(store.path).load()["last_candle_open_time_ms"] == 49
+
+
+def test_batched_save_flushes_after_debounce(tmp_path):
+    store = BatchedStateStore(str(tmp_path / "runtime_state.json"), debounce_ms=10)
+    state = store.load()
+    state["halted"] = True
+    store.save(state)
+
+    deadline = time.monotonic() + 2.0
+    while store.dirty and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert store.dirty is False
+    assert StateStore(store.path).load()["halted"] is True
+
 
-        exchange_position = {
-            "symbol": "PAXG_USDT_Perp",
-            "side": "sell",
-            "amount_base": 0.5,
-        }
-        result = store.reconcile(DummyExecutor(exchange_position), "PAXG_USDT_Perp")
-
-        assert result.mismatch is True
-        assert result.state["open_position"]["side"] == "sell"
-        assert result.state["open_position"]["amount_base"] == 0.5
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+def test_positions_mismatch_compares_side_and_quantized_qty():
+    long_half = {"side": "BUY", "amount_base": 0.5}
+    assert StateStore._positions_mismatch(None, None) is False
+    assert StateStore._positions_mismatch(long_half, None) is True
+    assert StateStore._positions_mismatch(long_half, {"side": "buy", "amount_base": 0.5 + 1e-12}) is False
+    assert StateStore._positions_mismatch(long_half, {"side": "sell", "amount_base": 0.5}) is True
+    assert StateStore._positions_mismatch(long_half, {"side": "buy", "amount_base": 0.51}) is True
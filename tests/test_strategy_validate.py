@@ -0,0 +1,53 @@
+import copy
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from grvt_bot.strategies.paxg_mean_reversion_strategy import (  # noqa: E402
+    PAXGMeanReversionStrategy,
+)
+from tests.strategy_data import MockConfig, generate_data  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def data():
+    return generate_data(100)
+
+
+@pytest.fixture(scope="module")
+def strategy(data):
+    """Warmed-up strategy; tests that append candles work on a copy."""
+    warmed = PAXGMeanReversionStrategy(MockConfig())
+    warmed.update_market_data(data)
+    assert warmed.last_indicators
+    return warmed
+
+
+def _probe(strategy, data, outlier):
+    # A closed candle far outside one band, then a normal candle at the last close.
+    last_close = float(data["close"].iloc[-1])
+    probe = copy.deepcopy(strategy)
+    probe.append_candle(outlier, outlier, outlier, outlier)
+    probe.append_candle(last_close, last_close, last_close, last_close)
+    return probe.get_signal()
+
+
+def test_buy_signal(strategy, data):
+    bands = strategy.last_indicators
+    signal = _probe(strategy, data, bands["bb_low"] - 3 * (bands["bb_mid"] - bands["bb_low"]))
+    assert signal and signal["side"] == "buy"
+
+
+def test_sell_signal(strategy, data):
+    bands = strategy.last_indicators
+    signal = _probe(strategy, data, bands["bb_high"] + 3 * (bands["bb_high"] - bands["bb_mid"]))
+    assert signal and signal["side"] == "sell"
+
+
+def test_exit_signal(strategy):
+    # Buy side convention used by the main loop
+    mid_band = strategy.last_indicators["bb_mid"]
+    exit_signal = strategy.check_exit(mid_band + 5, {"side": "buy", "entry_price": 2000})
+    assert exit_signal and exit_signal["action"] == "close"